@@ -12,12 +12,17 @@ This tool provides comprehensive security analysis including:
 """
 
 import argparse
+import atexit
 import json
 import os
 import sys
 import datetime
 import logging
+import queue
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
 from pathlib import Path
 
 # Visual enhancements
@@ -31,6 +36,53 @@ except ImportError:
     COLORS_AVAILABLE = False
     print("Install colorama, tqdm, and tabulate for enhanced visuals: pip install colorama tqdm tabulate")
 
+# Only pay for colors and progress bars when writing to a terminal
+IS_TTY = sys.stdout.isatty()
+USE_PROGRESS_BARS = COLORS_AVAILABLE and IS_TTY
+
+# Pre-rendered "<icon> [STATUS]" prefixes for print_status
+if COLORS_AVAILABLE:
+    STATUS_PREFIX = {
+        status: f"{color}{icon} [{status}]{Style.RESET_ALL}"
+        for status, (color, icon) in {
+            "INFO": (Fore.BLUE, "ℹ️"),
+            "SUCCESS": (Fore.GREEN, "✅"),
+            "WARNING": (Fore.YELLOW, "⚠️"),
+            "ERROR": (Fore.RED, "❌"),
+            "CRITICAL": (Fore.MAGENTA, "🚨"),
+            "SCANNING": (Fore.CYAN, "🔍"),
+            "ANALYZING": (Fore.YELLOW, "🔬"),
+            "REPORTING": (Fore.GREEN, "📊")
+        }.items()
+    }
+    
+    # Shared tqdm settings for each pipeline stage
+    PROGRESS_BARS = {
+        'components': {
+            'desc': f"{Fore.CYAN}🔧 Loading components{Style.RESET_ALL}",
+            'bar_format': "{desc}: {percentage:3.0f}%|{bar:30}| {n_fmt}/{total_fmt} [{elapsed}]",
+            'colour': "cyan"
+        },
+        'network': {
+            'desc': f"{Fore.CYAN}🌐 Network scanning{Style.RESET_ALL}",
+            'bar_format': "{desc}: {percentage:3.0f}%|{bar:30}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]",
+            'colour': "cyan"
+        },
+        'payloads': {
+            'desc': f"{Fore.YELLOW}⚡ Generating payloads{Style.RESET_ALL}",
+            'bar_format': "{desc}: {percentage:3.0f}%|{bar:30}| {n_fmt}/{total_fmt}",
+            'colour': "yellow"
+        },
+        'reports': {
+            'desc': f"{Fore.GREEN}📄 Individual reports{Style.RESET_ALL}",
+            'bar_format': "{desc}: {percentage:3.0f}%|{bar:20}| {n_fmt}/{total_fmt}",
+            'colour': "green"
+        }
+    }
+else:
+    STATUS_PREFIX = {}
+    PROGRESS_BARS = {}
+
 # Internal modules
 try:
     from modules.data_parser import ScanDataParser
@@ -49,8 +101,11 @@ except ImportError as e:
 __version__ = "1.0.0"
 __author__ = "VANGUARD Security Team"
 
-def print_banner():
-    """Display the VANGUARD banner."""
+# Weights used to score overall risk from severity counts
+SEVERITY_WEIGHTS = {'Critical': 4, 'High': 3, 'Medium': 2, 'Low': 1}
+
+def _build_banner():
+    """Render the VANGUARD banner, with ANSI colors when available."""
     if COLORS_AVAILABLE:
         banner = f"""
 {Fore.MAGENTA}████████████████████████████████████████████████████████████████████████████████████████████████████████{Style.RESET_ALL}
@@ -103,39 +158,109 @@ Version: 1.0.0 | Author: VANGUARD Security Team
 ════════════════════════════════════════════════
 
 """
-    print(banner)
+    return banner + "\n"
+
+# Rendered once at import; the banner never changes during a run
+BANNER = _build_banner()
+
+def print_banner():
+    """Display the VANGUARD banner."""
+    sys.stdout.write(BANNER)
+
+# [epoch second, formatted "%H:%M:%S"] of the last status line
+_last_status_time = [None, ""]
+
+def _status_timestamp():
+    """Return the wall-clock time for status lines, formatted once per second."""
+    now = int(time.time())
+    if _last_status_time[0] != now:
+        _last_status_time[:] = [now, time.strftime("%H:%M:%S", time.localtime(now))]
+    return _last_status_time[1]
 
 def print_status(message, status="INFO"):
     """Print colored status messages."""
-    if not COLORS_AVAILABLE:
+    if not (COLORS_AVAILABLE and IS_TTY):
         print(f"[{status}] {message}")
         return
         
-    colors = {
-        "INFO": Fore.BLUE,
-        "SUCCESS": Fore.GREEN,
-        "WARNING": Fore.YELLOW,
-        "ERROR": Fore.RED,
-        "CRITICAL": Fore.MAGENTA,
-        "SCANNING": Fore.CYAN,
-        "ANALYZING": Fore.YELLOW,
-        "REPORTING": Fore.GREEN
-    }
+    prefix = STATUS_PREFIX.get(status)
+    if prefix is None:
+        prefix = f"{Fore.WHITE}• [{status}]{Style.RESET_ALL}"
+    timestamp = _status_timestamp()
+    print(f"{Fore.WHITE}[{timestamp}] {prefix} {message}")
+
+class SummaryTable:
+    """
+    Fixed-shape two-column table in tabulate's fancy_grid style.
     
-    color = colors.get(status, Fore.WHITE)
-    timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-    icons = {
-        "INFO": "ℹ️",
-        "SUCCESS": "✅",
-        "WARNING": "⚠️",
-        "ERROR": "❌",
-        "CRITICAL": "🚨",
-        "SCANNING": "🔍",
-        "ANALYZING": "🔬",
-        "REPORTING": "📊"
-    }
-    icon = icons.get(status, "•")
-    print(f"{Fore.WHITE}[{timestamp}] {color}{icon} [{status}]{Style.RESET_ALL} {message}")
+    Borders, headers and the padded label cell of every row are laid out
+    once, so rendering only formats the values.
+    """
+    
+    def __init__(self, headers, labels, value_width=12, value_align='>'):
+        """
+        Args:
+            headers: (label header, value header) plain-text pair
+            labels: List of (color, text) pairs for the label column
+            value_width: Width of the value column
+            value_align: Format alignment for values ('<' or '>')
+        """
+        label_width = max(len(headers[0]), *(len(text) for _, text in labels))
+        value_width = max(value_width, len(headers[1]))
+        
+        def border(left, fill, mid, right):
+            return f"{left}{fill * (label_width + 2)}{mid}{fill * (value_width + 2)}{right}\n"
+        
+        def cell(color, text, width, align):
+            padding = ' ' * (width - len(text))
+            colored = f"{color}{text}{Style.RESET_ALL}"
+            return colored + padding if align == '<' else padding + colored
+        
+        self.top = border('╒', '═', '╤', '╕')
+        self.header = (
+            f"│ {cell(Fore.MAGENTA, headers[0], label_width, '<')} │ "
+            f"{cell(Fore.MAGENTA, headers[1], value_width, value_align)} │\n"
+        )
+        self.header_rule = border('╞', '═', '╪', '╡')
+        self.row_rule = border('├', '─', '┼', '┤')
+        self.bottom = border('╘', '═', '╧', '╛').rstrip('\n')
+        self.row_prefixes = [f"│ {cell(color, text, label_width, '<')} │ " for color, text in labels]
+        self.value_format = f"{{:{value_align}{value_width}}} │\n"
+    
+    def render(self, values):
+        """Render the table with one value per label row."""
+        rows = [
+            prefix + self.value_format.format(value)
+            for prefix, value in zip(self.row_prefixes, values)
+        ]
+        return self.top + self.header + self.header_rule + self.row_rule.join(rows) + self.bottom
+
+if COLORS_AVAILABLE:
+    VULNERABILITY_SUMMARY_TABLE = SummaryTable(
+        ("Metric", "Count"),
+        [
+            (Fore.BLUE, "Total Targets"),
+            (Fore.BLUE, "Affected URLs"),
+            (Fore.RED, "🚨 Critical"),
+            (Fore.YELLOW, "⚠️  High"),
+            (Fore.GREEN, "📊 Medium"),
+            (Fore.CYAN, "ℹ️  Low")
+        ],
+        value_width=7
+    )
+    EXECUTION_SUMMARY_TABLE = SummaryTable(
+        ("Statistic", "Value"),
+        [
+            (Fore.BLUE, "⏱️  Execution Time"),
+            (Fore.BLUE, "🎯 Targets Scanned"),
+            (Fore.BLUE, "🔍 Vulnerabilities Found"),
+            (Fore.BLUE, "📊 Reports Generated"),
+            (Fore.BLUE, "⚡ Payloads Generated"),
+            (Fore.BLUE, "💾 CVE Cache Hits")
+        ],
+        value_width=16,
+        value_align='<'
+    )
 
 # Set up logging with enhanced formatting
 class ColoredFormatter(logging.Formatter):
@@ -164,7 +289,7 @@ def setup_logging(log_level=logging.INFO):
     Path("logs").mkdir(exist_ok=True)
     
     # File handler with rotation
-    from logging.handlers import RotatingFileHandler
+    from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
     file_handler = RotatingFileHandler(
         "logs/vanguard.log", maxBytes=10*1024*1024, backupCount=5
     )
@@ -177,11 +302,23 @@ def setup_logging(log_level=logging.INFO):
     else:
         console_handler.setFormatter(logging.Formatter(log_format))
     
+    # Hand records to a background thread so callers never block on disk I/O
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+    
+    # The queue handler only merges args/exceptions into the message; the
+    # real handlers apply log_format on the listener thread
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    
     # Root logger configuration
     logging.basicConfig(
         level=log_level,
-        handlers=[file_handler, console_handler],
-        format=log_format
+        handlers=[queue_handler]
     )
 
 logger = logging.getLogger("vanguard")
@@ -195,6 +332,11 @@ class VANGUARD:
         self.output_dir = Path(args.output_dir)
         self.output_dir.mkdir(exist_ok=True, parents=True)
         
+        # Output directories are created once here rather than per stage
+        self.payload_dir = self.output_dir / "payloads"
+        if args.generate_payloads:
+            self.payload_dir.mkdir(exist_ok=True, parents=True)
+        
         print_status("Initializing VANGUARD framework...", "INFO")
         
         # Initialize progress tracking
@@ -203,7 +345,8 @@ class VANGUARD:
             'targets_scanned': 0,
             'vulnerabilities_found': 0,
             'reports_generated': 0,
-            'payloads_generated': 0
+            'payloads_generated': 0,
+            'cve_cache_hits': 0
         }
         
         # Initialize core components
@@ -213,97 +356,120 @@ class VANGUARD:
 
     def _initialize_components(self):
         """Initialize all framework components."""
+        # Independent components, constructed concurrently to overlap their I/O
         components = [
-            ("Data Parser", lambda: ScanDataParser()),
-            ("CVE Matcher", lambda: CVEMatcher(self.args.cve_database)),
-            ("Evidence Collector", lambda: EvidenceCollector(
+            ("Data Parser", "parser", ScanDataParser),
+            ("CVE Matcher", "cve_matcher", partial(
+                CVEMatcher,
+                self.args.cve_database,
+                nvd_feed_years=self.args.nvd_feed_years
+            )),
+            ("Evidence Collector", "evidence_collector", partial(
+                EvidenceCollector,
                 output_dir=self.output_dir / "evidence",
                 capture_screenshots=self.args.capture_screenshots,
                 save_http=self.args.save_http
             )),
-            ("Network Scanner", lambda: NetworkScanner(
+            ("Network Scanner", "network_scanner", partial(
+                NetworkScanner,
                 timeout=self.args.scan_timeout,
                 max_workers=self.args.max_workers,
                 rate_limit=self.args.rate_limit
             )),
-            ("Payload Generator", lambda: PayloadGenerator()),
-            ("Vulnerability Analyzer", lambda: VulnerabilityAnalyzer(
-                self.cve_matcher,
-                self.evidence_collector,
-                verify_vulnerabilities=not self.args.no_verification
-            )),
-            ("Report Generator", lambda: ReportGenerator(
+            ("Payload Generator", "payload_generator", PayloadGenerator),
+            ("Report Generator", "report_generator", partial(
+                ReportGenerator,
                 output_format=self.args.format,
                 template_dir=self.args.template_dir,
-                output_dir=self.output_dir
+                output_dir=self.output_dir,
+                compress=self.args.compress_reports
             ))
         ]
         
-        if COLORS_AVAILABLE:
+        if USE_PROGRESS_BARS:
             pbar = tqdm(
-                components, 
-                desc=f"{Fore.CYAN}🔧 Loading components{Style.RESET_ALL}", 
-                bar_format="{desc}: {percentage:3.0f}%|{bar:30}| {n_fmt}/{total_fmt} [{elapsed}]",
-                colour="cyan"
+                total=len(components) + 1,  # +1 for the vulnerability analyzer
+                **PROGRESS_BARS['components']
             )
         else:
-            pbar = components
+            pbar = None
             
-        for name, initializer in pbar:
-            try:
-                if name == "Data Parser":
-                    self.parser = initializer()
-                elif name == "CVE Matcher":
-                    self.cve_matcher = initializer()
-                elif name == "Evidence Collector":
-                    self.evidence_collector = initializer()
-                elif name == "Network Scanner":
-                    self.network_scanner = initializer()
-                elif name == "Payload Generator":
-                    self.payload_generator = initializer()
-                elif name == "Vulnerability Analyzer":
-                    self.analyzer = initializer()
-                elif name == "Report Generator":
-                    self.report_generator = initializer()
-                    
-                if not COLORS_AVAILABLE:
-                    print_status(f"{name} initialized", "SUCCESS")
-                    
-            except Exception as e:
-                print_status(f"Failed to initialize {name}: {str(e)}", "ERROR")
-                raise
+        try:
+            with ThreadPoolExecutor(max_workers=len(components)) as executor:
+                future_to_component = {
+                    executor.submit(initializer): (name, attr)
+                    for name, attr, initializer in components
+                }
+                for future in as_completed(future_to_component):
+                    name, attr = future_to_component[future]
+                    self._install_component(name, attr, future.result, pbar)
+            
+            # The analyzer depends on the CVE matcher and evidence collector
+            self._install_component("Vulnerability Analyzer", "analyzer", partial(
+                VulnerabilityAnalyzer,
+                self.cve_matcher,
+                self.evidence_collector,
+                verify_vulnerabilities=not self.args.no_verification
+            ), pbar)
+        finally:
+            if pbar is not None:
+                pbar.close()
+
+    def _install_component(self, name, attr, initializer, pbar=None):
+        """Build a component and bind it to this instance as `attr`."""
+        try:
+            setattr(self, attr, initializer())
+        except Exception as e:
+            print_status(f"Failed to initialize {name}: {str(e)}", "ERROR")
+            raise
+            
+        if pbar is not None:
+            pbar.update(1)
+        else:
+            print_status(f"{name} initialized", "SUCCESS")
 
     def run(self):
         """Run the complete VANGUARD analysis process."""
-        start_time = time.time()
+        start_time = time.monotonic()
         print_status(f"Starting VANGUARD analysis of {self.args.scan_file}", "SCANNING")
         
         try:
-            # Step 1: Parse scan data
-            scan_data = self._parse_scan_data()
+            with ThreadPoolExecutor(max_workers=1) as stage_executor:
+                # Step 3: Generate payloads (if enabled). They do not depend on
+                # the scan data, so this runs alongside steps 1 and 2
+                payload_future = None
+                if self.args.generate_payloads:
+                    payload_future = stage_executor.submit(self._generate_test_payloads)
+                
+                # Step 1 + 2: Parse scan data, streaming entries straight into
+                # enhanced network scanning (if enabled)
+                if self.args.network_scan:
+                    scan_data = self._enhance_with_network_scan(self._stream_scan_data())
+                else:
+                    scan_data = self._parse_scan_data()
+                
+                if payload_future is not None:
+                    payload_future.result()
+            
             if not scan_data:
                 return 1
             
-            # Step 2: Enhanced network scanning (if enabled)
-            if self.args.network_scan:
-                scan_data = self._enhance_with_network_scan(scan_data)
-            
-            # Step 3: Generate payloads (if enabled)
-            if self.args.generate_payloads:
-                self._generate_test_payloads()
-            
             # Step 4: Analyze vulnerabilities
             findings = self._analyze_vulnerabilities(scan_data)
             
             # Step 5: Generate reports
             if findings:
                 self._generate_reports(findings)
-                self._display_summary(findings)
+                self._display_summary(
+                    findings,
+                    severity_counts=self.analyzer.severity_counts,
+                    vuln_types=self.analyzer.type_counts
+                )
             else:
                 print_status("No vulnerabilities found to report", "WARNING")
             
             # Execution summary
-            execution_time = time.time() - start_time
+            execution_time = time.monotonic() - start_time
             self._display_execution_summary(execution_time)
             
             return 0
@@ -329,41 +495,78 @@ class VANGUARD:
             print_status(f"Failed to parse scan file: {str(e)}", "ERROR")
             return None
 
-    def _enhance_with_network_scan(self, scan_data):
-        """Enhance scan data with additional network scanning."""
+    def _stream_scan_data(self):
+        """Lazily yield entries from the input scan data file."""
+        print_status("Parsing scan data...", "ANALYZING")
+        
+        try:
+            for entry in self.parser.parse_file_iter(self.args.scan_file):
+                self.stats['targets_scanned'] += 1
+                yield entry
+        except Exception as e:
+            print_status(f"Failed to parse scan file: {str(e)}", "ERROR")
+            raise
+        
+        print_status(f"Successfully parsed {self.stats['targets_scanned']} scan entries", "SUCCESS")
+
+    def _enhance_with_network_scan(self, scan_entries):
+        """
+        Enhance scan data with additional network scanning.
+        
+        scan_entries may be a lazy iterator; each target is submitted for
+        scanning as soon as its entry is parsed.
+        """
         print_status("Performing enhanced network scanning...", "SCANNING")
         
-        enhanced_data = []
-        targets = [entry.get('URL', entry.get('target', '')) for entry in scan_data]
+        scan_data = []
+        entry_index = {}
+        future_to_target = {}
+        submitted_targets = set()
+        enhanced_ids = set()
         
-        if COLORS_AVAILABLE:
-            pbar = tqdm(
-                targets, 
-                desc=f"{Fore.CYAN}🌐 Network scanning{Style.RESET_ALL}", 
-                bar_format="{desc}: {percentage:3.0f}%|{bar:30}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]",
-                colour="cyan"
-            )
-        else:
-            pbar = targets
+        # Scan targets concurrently; each scan is dominated by socket waits
+        with ThreadPoolExecutor(max_workers=max(1, self.args.max_workers)) as executor:
+            for entry in scan_entries:
+                scan_data.append(entry)
+                
+                # Index entries by target once so each merge is a dict lookup
+                for key in (entry.get('URL'), entry.get('target')):
+                    if key:
+                        entry_index.setdefault(key, entry)
+                
+                target = entry.get('URL', entry.get('target', ''))
+                if target and target not in submitted_targets:
+                    submitted_targets.add(target)
+                    future_to_target[executor.submit(self.network_scanner.scan_target, target)] = target
             
-        for target in pbar:
-            if target:
+            if USE_PROGRESS_BARS:
+                pbar = tqdm(
+                    as_completed(future_to_target),
+                    total=len(future_to_target),
+                    **PROGRESS_BARS['network']
+                )
+            else:
+                pbar = as_completed(future_to_target)
+                
+            for future in pbar:
+                target = future_to_target[future]
                 try:
-                    network_info = self.network_scanner.scan_target(target)
-                    if network_info:
+                    network_info = future.result()
+                    entry = entry_index.get(target)
+                    if network_info and entry is not None:
                         # Merge network scan results with existing data
-                        for entry in scan_data:
-                            if entry.get('URL') == target or entry.get('target') == target:
-                                entry.update({
-                                    'network_info': network_info,
-                                    'open_ports': network_info.get('open_ports', []),
-                                    'services': network_info.get('services', {}),
-                                    'web_servers': network_info.get('web_servers', [])
-                                })
-                                enhanced_data.append(entry)
-                                break
+                        entry.update({
+                            'network_info': network_info,
+                            'open_ports': network_info.get('open_ports', []),
+                            'services': network_info.get('services', {}),
+                            'web_servers': network_info.get('web_servers', [])
+                        })
+                        enhanced_ids.add(id(entry))
                 except Exception as e:
-                    logger.debug(f"Network scan failed for {target}: {str(e)}")
+                    logger.debug("Network scan failed for %s: %s", target, e)
+        
+        # Keep the original scan order regardless of completion order
+        enhanced_data = [entry for entry in scan_data if id(entry) in enhanced_ids]
                     
         print_status(f"Enhanced {len(enhanced_data)} targets with network data", "SUCCESS")
         return enhanced_data if enhanced_data else scan_data
@@ -372,39 +575,57 @@ class VANGUARD:
         """Generate test payloads for manual testing."""
         print_status("Generating test payloads...", "ANALYZING")
         
-        payload_dir = self.output_dir / "payloads"
-        payload_dir.mkdir(exist_ok=True)
-        
         vuln_types = ['sqli', 'xss', 'rce', 'lfi', 'xxe', 'ssti']
         total_payloads = 0
+        generated_on = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         
-        if COLORS_AVAILABLE:
-            pbar = tqdm(
-                vuln_types, 
-                desc=f"{Fore.YELLOW}⚡ Generating payloads{Style.RESET_ALL}",
-                bar_format="{desc}: {percentage:3.0f}%|{bar:30}| {n_fmt}/{total_fmt}",
-                colour="yellow"
-            )
-        else:
-            pbar = vuln_types
-        
-        for vuln_type in pbar:
-            payloads = self.payload_generator.generate_payloads(
+        # Selection is cheap in-process work; the file writes are what overlap
+        generated = {
+            vuln_type: self.payload_generator.generate_payloads(
                 vuln_type, count=25, context='web'
             )
+            for vuln_type in vuln_types
+        }
+        
+        with ThreadPoolExecutor(max_workers=len(vuln_types)) as executor:
+            future_to_type = {
+                executor.submit(
+                    self._write_payload_file,
+                    self.payload_dir / f"{vuln_type}_payloads.txt",
+                    vuln_type,
+                    payloads,
+                    generated_on
+                ): vuln_type
+                for vuln_type, payloads in generated.items()
+            }
             
-            payload_file = payload_dir / f"{vuln_type}_payloads.txt"
-            with open(payload_file, 'w') as f:
-                f.write(f"# {vuln_type.upper()} Test Payloads\n")
-                f.write(f"# Generated by VANGUARD v{__version__}\n")
-                f.write(f"# Generated on: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-                for i, payload in enumerate(payloads, 1):
-                    f.write(f"{i:2d}. {payload}\n")
+            if USE_PROGRESS_BARS:
+                pbar = tqdm(
+                    as_completed(future_to_type),
+                    total=len(future_to_type),
+                    **PROGRESS_BARS['payloads']
+                )
+            else:
+                pbar = as_completed(future_to_type)
             
-            total_payloads += len(payloads)
+            for future in pbar:
+                future.result()
+                total_payloads += len(generated[future_to_type[future]])
                     
         self.stats['payloads_generated'] = total_payloads
-        print_status(f"Generated {total_payloads} payloads saved to {payload_dir}", "SUCCESS")
+        print_status(f"Generated {total_payloads} payloads saved to {self.payload_dir}", "SUCCESS")
+
+    def _write_payload_file(self, payload_file, vuln_type, payloads, generated_on):
+        """Write a numbered payload list for one vulnerability type."""
+        header = (
+            f"# {vuln_type.upper()} Test Payloads\n"
+            f"# Generated by VANGUARD v{__version__}\n"
+            f"# Generated on: {generated_on}\n\n"
+        )
+        lines = [f"{i:2d}. {payload}\n" for i, payload in enumerate(payloads, 1)]
+        
+        # One encode and one write; no text-layer chunking
+        payload_file.write_bytes((header + ''.join(lines)).encode('utf-8'))
 
     def _analyze_vulnerabilities(self, scan_data):
         """Analyze scan data for vulnerabilities."""
@@ -412,9 +633,10 @@ class VANGUARD:
         
         findings = self.analyzer.analyze(scan_data)
         
-        # Count total vulnerabilities
-        total_vulns = sum(len(finding.get('vulnerabilities', [])) for finding in findings)
+        # The analyzer tallies vulnerabilities while collecting results
+        total_vulns = sum(self.analyzer.severity_counts.values())
         self.stats['vulnerabilities_found'] = total_vulns
+        self.stats['cve_cache_hits'] = self.cve_matcher.cache_hits
         
         print_status(f"Found {len(findings)} targets with {total_vulns} vulnerabilities", "SUCCESS")
         
@@ -443,24 +665,26 @@ class VANGUARD:
         
         # Individual reports
         if self.args.individual_reports:
-            if COLORS_AVAILABLE:
+            # Reports render in worker threads and arrive in findings order
+            report_paths = enumerate(
+                self.report_generator.generate_vulnerability_reports(findings), 1
+            )
+            if USE_PROGRESS_BARS:
                 pbar = tqdm(
-                    enumerate(findings, 1), 
+                    report_paths, 
                     total=len(findings),
-                    desc=f"{Fore.GREEN}📄 Individual reports{Style.RESET_ALL}",
-                    bar_format="{desc}: {percentage:3.0f}%|{bar:20}| {n_fmt}/{total_fmt}",
-                    colour="green"
+                    **PROGRESS_BARS['reports']
                 )
             else:
-                pbar = enumerate(findings, 1)
+                pbar = report_paths
                 
-            for i, finding in pbar:
-                vuln_report_path = self.report_generator.generate_single_vulnerability_report(
-                    finding, f"vulnerability_{i}"
-                )
+            for i, vuln_report_path in pbar:
                 if vuln_report_path:
                     reports_generated.append((f"Vulnerability {i}", vuln_report_path))
         
+        # Let queued PDF conversions finish before listing the reports
+        self.report_generator.close()
+        
         self.stats['reports_generated'] = len(reports_generated)
         
         # Display report summary
@@ -474,24 +698,23 @@ class VANGUARD:
             for name, path in reports_generated:
                 print(f"  • {name}: {path}")
 
-    def _display_summary(self, findings):
-        """Display comprehensive analysis summary."""
+    def _display_summary(self, findings, severity_counts=None, vuln_types=None):
+        """
+        Display comprehensive analysis summary.
+        
+        Precomputed severity and type counters are used when given;
+        otherwise they are counted from the findings.
+        """
         if not findings:
             return
             
+        affected_urls = {finding.get('url', 'Unknown') for finding in findings}
+        
         # Count vulnerabilities by severity
-        severity_counts = {'Critical': 0, 'High': 0, 'Medium': 0, 'Low': 0}
-        vuln_types = {}
-        affected_urls = set()
-        
-        for finding in findings:
-            affected_urls.add(finding.get('url', 'Unknown'))
-            for vuln in finding.get('vulnerabilities', []):
-                severity = vuln.get('severity', {}).get('rating', 'Medium')
-                severity_counts[severity] = severity_counts.get(severity, 0) + 1
-                
-                vuln_type = vuln.get('type', 'Unknown')
-                vuln_types[vuln_type] = vuln_types.get(vuln_type, 0) + 1
+        if severity_counts is None or vuln_types is None:
+            all_vulns = [vuln for finding in findings for vuln in finding.get('vulnerabilities', [])]
+            severity_counts = Counter(vuln.get('severity', {}).get('rating', 'Medium') for vuln in all_vulns)
+            vuln_types = Counter(vuln.get('type', 'Unknown') for vuln in all_vulns)
         
         if COLORS_AVAILABLE:
             print(f"\n{Fore.CYAN}{'='*60}{Style.RESET_ALL}")
@@ -499,27 +722,27 @@ class VANGUARD:
             print(f"{Fore.CYAN}{'='*60}{Style.RESET_ALL}")
             
             # Main summary table
-            summary_data = [
-                [f"{Fore.BLUE}Total Targets{Style.RESET_ALL}", len(findings)],
-                [f"{Fore.BLUE}Affected URLs{Style.RESET_ALL}", len(affected_urls)],
-                [f"{Fore.RED}🚨 Critical{Style.RESET_ALL}", severity_counts['Critical']],
-                [f"{Fore.YELLOW}⚠️  High{Style.RESET_ALL}", severity_counts['High']],
-                [f"{Fore.GREEN}📊 Medium{Style.RESET_ALL}", severity_counts['Medium']],
-                [f"{Fore.CYAN}ℹ️  Low{Style.RESET_ALL}", severity_counts['Low']]
-            ]
-            
-            print(tabulate(summary_data, headers=[f"{Fore.MAGENTA}Metric{Style.RESET_ALL}", f"{Fore.MAGENTA}Count{Style.RESET_ALL}"], tablefmt="fancy_grid"))
+            print(VULNERABILITY_SUMMARY_TABLE.render([
+                len(findings),
+                len(affected_urls),
+                severity_counts['Critical'],
+                severity_counts['High'],
+                severity_counts['Medium'],
+                severity_counts['Low']
+            ]))
             
             # Vulnerability types
             if vuln_types:
-                vuln_data = [[f"{Fore.YELLOW}{vtype}{Style.RESET_ALL}", count] for vtype, count in sorted(vuln_types.items(), key=lambda x: x[1], reverse=True)]
+                vuln_data = [[f"{Fore.YELLOW}{vtype}{Style.RESET_ALL}", count] for vtype, count in vuln_types.most_common()]
                 print(f"\n{Fore.CYAN}🔍 VULNERABILITY TYPES BREAKDOWN{Style.RESET_ALL}")
                 print(tabulate(vuln_data, headers=[f"{Fore.MAGENTA}Vulnerability Type{Style.RESET_ALL}", f"{Fore.MAGENTA}Count{Style.RESET_ALL}"], tablefmt="fancy_grid"))
                 
             # Risk assessment
             total_vulns = sum(severity_counts.values())
-            risk_score = (severity_counts['Critical'] * 4 + severity_counts['High'] * 3 + 
-                         severity_counts['Medium'] * 2 + severity_counts['Low'] * 1)
+            risk_score = sum(
+                SEVERITY_WEIGHTS.get(severity, 0) * count
+                for severity, count in severity_counts.items()
+            )
             
             if risk_score >= total_vulns * 3:
                 risk_level = f"{Fore.RED}🚨 CRITICAL{Style.RESET_ALL}"
@@ -545,7 +768,7 @@ class VANGUARD:
             
             if vuln_types:
                 print("\nVulnerability Types:")
-                for vtype, count in sorted(vuln_types.items(), key=lambda x: x[1], reverse=True):
+                for vtype, count in vuln_types.most_common():
                     print(f"  {vtype}: {count}")
 
     def _display_execution_summary(self, execution_time):
@@ -555,15 +778,14 @@ class VANGUARD:
             print(f"{Fore.GREEN}🎉 VANGUARD EXECUTION SUMMARY 🎉{Style.RESET_ALL}")
             print(f"{Fore.GREEN}{'='*60}{Style.RESET_ALL}")
             
-            stats_data = [
-                [f"{Fore.BLUE}⏱️  Execution Time{Style.RESET_ALL}", f"{execution_time:.2f} seconds"],
-                [f"{Fore.BLUE}🎯 Targets Scanned{Style.RESET_ALL}", self.stats['targets_scanned']],
-                [f"{Fore.BLUE}🔍 Vulnerabilities Found{Style.RESET_ALL}", self.stats['vulnerabilities_found']],
-                [f"{Fore.BLUE}📊 Reports Generated{Style.RESET_ALL}", self.stats['reports_generated']],
-                [f"{Fore.BLUE}⚡ Payloads Generated{Style.RESET_ALL}", self.stats['payloads_generated']]
-            ]
-            
-            print(tabulate(stats_data, headers=[f"{Fore.MAGENTA}Statistic{Style.RESET_ALL}", f"{Fore.MAGENTA}Value{Style.RESET_ALL}"], tablefmt="fancy_grid"))
+            print(EXECUTION_SUMMARY_TABLE.render([
+                f"{execution_time:.2f} seconds",
+                self.stats['targets_scanned'],
+                self.stats['vulnerabilities_found'],
+                self.stats['reports_generated'],
+                self.stats['payloads_generated'],
+                self.stats['cve_cache_hits']
+            ]))
             print(f"{Fore.GREEN}✅ Analysis completed successfully!{Style.RESET_ALL}")
             print(f"{Fore.GREEN}{'='*60}{Style.RESET_ALL}")
         else:
@@ -575,6 +797,7 @@ class VANGUARD:
             print(f"Vulnerabilities Found: {self.stats['vulnerabilities_found']}")
             print(f"Reports Generated: {self.stats['reports_generated']}")
             print(f"Payloads Generated: {self.stats['payloads_generated']}")
+            print(f"CVE Cache Hits: {self.stats['cve_cache_hits']}")
             print("✅ Analysis completed successfully!")
             print("="*60)
 
@@ -613,6 +836,9 @@ def parse_arguments():
     parser.add_argument("--individual-reports", 
                        action="store_true",
                        help="Generate individual vulnerability reports")
+    parser.add_argument("--compress-reports", 
+                       action="store_true",
+                       help="Write HTML, Markdown and JSON reports gzip-compressed")
 
     # Enhanced analysis options
     parser.add_argument("--network-scan", 
@@ -649,6 +875,10 @@ def parse_arguments():
     parser.add_argument("--cve-database", 
                        default="./data/cve_database.json",
                        help="Path to CVE database file")
+    parser.add_argument("--nvd-feed-years", 
+                       type=int, 
+                       nargs="+",
+                       help="Build the CVE database from these years of NVD feeds")
 
     # Analysis options
     parser.add_argument("--no-verification", 
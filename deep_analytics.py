@@ -21,13 +21,43 @@ from modules.evidence_collector import EvidenceCollector
 from modules.report_generator import ReportGenerator
 from modules.cve_matcher import CVEMatcher
 
-# Set up logging
+class BufferedStreamHandler(logging.StreamHandler):
+    """
+    StreamHandler that leaves batching to the stream's buffer.
+
+    Records are only flushed immediately from ERROR upwards; everything else
+    is written out when the buffer fills or the handler is closed at exit.
+    """
+
+    flush_level = logging.ERROR
+
+    def emit(self, record):
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= self.flush_level:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class BufferedFileHandler(BufferedStreamHandler, logging.FileHandler):
+    """FileHandler writing through a large buffer to batch write() syscalls."""
+
+    buffer_size = 64 * 1024
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size, encoding=self.encoding)
+
+
+# Set up logging; an interactive console still gets every line as it happens
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler("deep_analytics.log"),
-        logging.StreamHandler(sys.stdout)
+        BufferedFileHandler("deep_analytics.log"),
+        logging.StreamHandler(sys.stdout) if sys.stdout.isatty() else BufferedStreamHandler(sys.stdout)
     ]
 )
 logger = logging.getLogger("deep_analytics")
@@ -43,7 +73,7 @@ class DeepAnalytics:
 
         # Initialize components
         self.parser = ScanDataParser()
-        self.cve_matcher = CVEMatcher(args.cve_database)
+        self.cve_matcher = CVEMatcher(args.cve_database, nvd_feed_years=args.nvd_feed_years)
         self.evidence_collector = EvidenceCollector(
             output_dir=self.output_dir / "evidence",
             capture_screenshots=args.capture_screenshots,
@@ -57,23 +87,43 @@ class DeepAnalytics:
         self.report_generator = ReportGenerator(
             output_format=args.format,
             template_dir=args.template_dir,
-            output_dir=self.output_dir
+            output_dir=self.output_dir,
+            compress=args.compress_reports
         )
 
+    def _count_entries(self, scan_entries):
+        """Pass scan entries through while counting them, recording any parse error."""
+        try:
+            for entry in scan_entries:
+                self.entries_parsed += 1
+                yield entry
+        except Exception as e:
+            # Parsing is lazy, so parse errors surface inside the analyzer
+            self.parse_error = e
+            raise
+
     def run(self):
         """Run the full analysis process."""
         logger.info(f"Starting analysis of {self.args.scan_file}")
 
-        # Parse the scan data
+        # Parse the scan data, streaming entries straight into the vulnerability analyzer
+        self.entries_parsed = 0
+        self.parse_error = None
         try:
-            scan_data = self.parser.parse_file(self.args.scan_file)
-            logger.info(f"Successfully parsed {len(scan_data)} scan entries")
+            scan_entries = self._count_entries(self.parser.parse_file_iter(self.args.scan_file))
         except Exception as e:
             logger.error(f"Failed to parse scan file: {str(e)}")
             return 1
 
-        # Analyze vulnerabilities
-        findings = self.analyzer.analyze(scan_data)
+        try:
+            findings = self.analyzer.analyze(scan_entries)
+        except Exception as e:
+            if e is self.parse_error:
+                logger.error(f"Failed to parse scan file: {str(e)}")
+            else:
+                logger.error(f"Failed to analyze scan data: {str(e)}")
+            return 1
+        logger.info(f"Successfully parsed {self.entries_parsed} scan entries")
         logger.info(f"Found {len(findings)} potential vulnerabilities")
 
         # Generate and save the report
@@ -90,14 +140,14 @@ class DeepAnalytics:
                 summary_path = self.report_generator.generate_executive_summary(findings)
                 logger.info(f"Executive summary generated: {summary_path}")
 
-            # Generate individual vulnerability reports if requested
+            # Generate individual vulnerability reports if requested; each
+            # finding is written to its own file, so they render in parallel
             if self.args.individual_reports:
-                for i, finding in enumerate(findings, 1):
-                    vuln_report_path = self.report_generator.generate_single_vulnerability_report(
-                        finding,
-                        f"vulnerability_{i}"
-                    )
+                for vuln_report_path in self.report_generator.generate_vulnerability_reports(findings):
                     logger.info(f"Individual vulnerability report generated: {vuln_report_path}")
+
+            # Let queued PDF conversions finish
+            self.report_generator.close()
         else:
             logger.info("No vulnerabilities found to report")
 
@@ -128,6 +178,8 @@ def parse_arguments():
                         help="Generate an executive summary")
     parser.add_argument("--individual-reports", action="store_true",
                         help="Generate individual reports for each vulnerability")
+    parser.add_argument("--compress-reports", action="store_true",
+                        help="Write HTML, Markdown and JSON reports gzip-compressed")
 
     # Evidence collection options
     parser.add_argument("--capture-screenshots", action="store_true",
@@ -138,6 +190,8 @@ def parse_arguments():
     # CVE database options
     parser.add_argument("--cve-database", default="./data/cve_database.json",
                         help="Path to CVE database file or URL")
+    parser.add_argument("--nvd-feed-years", type=int, nargs="+",
+                        help="Build the CVE database from these years of NVD feeds")
 
     # Analysis options
     parser.add_argument("--no-verification", action="store_true",
@@ -4,29 +4,95 @@ CVE matcher module for finding related CVEs for detected vulnerabilities.
 """
 
 import logging
+import gzip
 import json
 import re
 import os
-import requests
+import pickle
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime, timedelta
 
+# Faster JSON decoding and encoding when orjson is installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Incremental decoding of NVD feeds when ijson is installed
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
 logger = logging.getLogger("deep_analytics.cve")
 
+# Yearly NVD JSON feeds, downloaded as gzipped batches rather than per CVE
+NVD_FEED_URL = "https://nvd.nist.gov/feeds/json/cve/2.0/nvdcve-2.0-{year}.json.gz"
+NVD_FEED_WORKERS = 8
+
+# CWE weaknesses mapped to the vulnerability types the analyzer reports
+CWE_VULN_TYPES = {
+    'CWE-89': 'SQLi',
+    'CWE-79': 'XSS',
+    'CWE-77': 'RCE',
+    'CWE-78': 'RCE',
+    'CWE-94': 'RCE',
+    'CWE-22': 'LFI',
+    'CWE-98': 'LFI'
+}
+
+# Separators between product names and versions in server banners,
+# e.g. "Apache/2.4.41 (Ubuntu) PHP/7.4" or "Microsoft-IIS/10.0"
+SERVER_TOKEN_PATTERN = re.compile(r'[\s/,;:()\-]+')
+
+
+# Map vulnerability types to CVE types
+VULN_TYPE_CVE_TYPES = {
+    'SQLi': 'SQLi',
+    'XSS': 'XSS',
+    'RCE': 'RCE',
+    'LFI': 'LFI'
+}
+
+
+def _tokenize(text_lc):
+    """Split already lowercased text into a set of banner tokens."""
+    return frozenset(token for token in SERVER_TOKEN_PATTERN.split(text_lc) if token)
+
 class CVEMatcher:
     """Matches vulnerabilities to known CVEs."""
 
-    def __init__(self, cve_database_path, auto_update=True):
+    def __init__(self, cve_database_path, auto_update=True, cache_size=8192, nvd_feed_years=None):
         """
         Initialize the CVE matcher.
 
         Args:
             cve_database_path: Path to CVE database file or URL
             auto_update: Whether to automatically update the database if older than 7 days
+            cache_size: Maximum number of lookup results kept in the LRU cache
+            nvd_feed_years: Years of NVD feeds to build the database from; sample data if None
         """
         self.cve_database_path = Path(cve_database_path)
+        # Parsed copy of the database, reused while it is newer than the JSON
+        self.cve_cache_path = self.cve_database_path.with_suffix('.pkl')
         self.auto_update = auto_update
+        self.nvd_feed_years = nvd_feed_years
         self.cve_data = self._load_cve_database()
+        self._by_type = self._build_type_index(self.cve_data)
+
+        # Per-instance LRU cache of positive lookups, shared by the analyzer's worker threads
+        self.cache_size = cache_size
+        self._find_cves_cached = lru_cache(maxsize=cache_size)(self._match_cves_or_raise)
+
+    @property
+    def cache_hits(self):
+        """Number of find_cves calls answered from the lookup cache."""
+        return self._find_cves_cached.cache_info().hits
 
     def _load_cve_database(self):
         """
@@ -47,37 +113,281 @@ class CVEMatcher:
             logger.info("CVE database not found. Creating...")
             self._update_cve_database()
 
+        # Reuse the parsed copy if the database hasn't changed since it was written
+        cve_data = self._load_parsed_cache()
+        if cve_data is not None:
+            return cve_data
+
         # Load the database
         try:
-            with open(self.cve_database_path, 'r') as f:
-                return json.load(f)
+            if ORJSON_AVAILABLE:
+                with open(self.cve_database_path, 'rb') as f:
+                    cve_data = orjson.loads(f.read())
+            else:
+                with open(self.cve_database_path, 'r') as f:
+                    cve_data = json.load(f)
+            self._save_parsed_cache(cve_data)
+            return cve_data
         except Exception as e:
             logger.error(f"Error loading CVE database: {str(e)}")
             # Return empty database as fallback
             return {'cves': []}
 
+    def _load_parsed_cache(self):
+        """
+        Load the pickled copy of the CVE database if it is up to date.
+
+        Returns:
+            Dictionary containing CVE data, or None if the cache is missing or stale
+        """
+        try:
+            if self.cve_cache_path.stat().st_mtime < self.cve_database_path.stat().st_mtime:
+                return None
+            with open(self.cve_cache_path, 'rb') as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable CVE database cache: {str(e)}")
+            return None
+
+    def _save_parsed_cache(self, cve_data):
+        """
+        Write a pickled copy of the parsed CVE database next to the JSON file.
+
+        Args:
+            cve_data: Dictionary containing CVE data
+        """
+        try:
+            with open(self.cve_cache_path, 'wb') as f:
+                pickle.dump(cve_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.warning(f"Could not write CVE database cache: {str(e)}")
+
+    @staticmethod
+    def _build_type_index(cve_data):
+        """
+        Index CVE entries by type with their affected systems prepared once.
+
+        Single-word systems are kept as a token set for hash lookups against
+        the server banner; multi-word systems keep their lowercased phrase for
+        a substring check.
+
+        Args:
+            cve_data: Dictionary containing CVE data
+
+        Returns:
+            Dictionary mapping CVE type to a list of (cve, system_tokens, system_phrases) tuples
+        """
+        by_type = defaultdict(list)
+        for cve in cve_data.get('cves', []):
+            system_tokens = set()
+            system_phrases = []
+            for system in cve.get('affected_systems', ()):
+                system_lc = system.lower()
+                tokens = _tokenize(system_lc)
+                if len(tokens) == 1:
+                    system_tokens.update(tokens)
+                elif tokens:
+                    system_phrases.append(system_lc)
+            by_type[cve.get('type')].append((cve, frozenset(system_tokens), tuple(system_phrases)))
+        return dict(by_type)
+
     def _update_cve_database(self):
         """Update the CVE database from official sources."""
         try:
             # Create parent directory if it doesn't exist
             self.cve_database_path.parent.mkdir(exist_ok=True, parents=True)
 
-            # In a real implementation, this would download from NVD or other CVE sources
-            # For demonstration, we'll create a simple database with common vulnerabilities
+            # Download from the NVD feeds if configured; otherwise create a
+            # simple database with common vulnerabilities for demonstration
+            if self.nvd_feed_years:
+                cves = self._download_nvd_cves(self.nvd_feed_years)
+            else:
+                cves = self._generate_sample_cves()
+
             cve_data = {
                 'last_updated': datetime.now().isoformat(),
-                'cves': self._generate_sample_cves()
+                'cves': cves
             }
 
             # Save the database
-            with open(self.cve_database_path, 'w') as f:
-                json.dump(cve_data, f, indent=2)
+            if ORJSON_AVAILABLE:
+                with open(self.cve_database_path, 'wb') as f:
+                    f.write(orjson.dumps(cve_data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(self.cve_database_path, 'w') as f:
+                    json.dump(cve_data, f, indent=2)
 
             logger.info(f"CVE database updated: {self.cve_database_path}")
 
         except Exception as e:
             logger.error(f"Error updating CVE database: {str(e)}")
 
+    def _download_nvd_cves(self, years):
+        """
+        Download the yearly NVD feeds concurrently and convert their entries.
+
+        Feeds are kept next to the database with their ETags, so later
+        updates only transfer the years that changed.
+
+        Args:
+            years: Iterable of feed years to download
+
+        Returns:
+            List of CVE entries in the database format
+        """
+        # Only import if needed
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        feed_dir = self.cve_database_path.parent / "nvd_feeds"
+        feed_dir.mkdir(exist_ok=True, parents=True)
+
+        feed_paths = []
+        with requests.Session() as session:
+            adapter = HTTPAdapter(pool_connections=NVD_FEED_WORKERS, pool_maxsize=NVD_FEED_WORKERS)
+            session.mount('https://', adapter)
+
+            with ThreadPoolExecutor(max_workers=NVD_FEED_WORKERS) as executor:
+                future_to_year = {
+                    executor.submit(self._fetch_nvd_feed, session, year, feed_dir): year
+                    for year in years
+                }
+
+                for future in as_completed(future_to_year):
+                    year = future_to_year[future]
+                    try:
+                        feed_paths.append(future.result())
+                    except Exception as e:
+                        logger.error(f"Error downloading NVD feed for {year}: {str(e)}")
+
+        if not feed_paths:
+            raise RuntimeError("No NVD feeds could be downloaded")
+
+        cves = []
+        for feed_path in sorted(feed_paths):
+            cves.extend(self._read_nvd_feed(feed_path))
+        return cves
+
+    def _fetch_nvd_feed(self, session, year, feed_dir):
+        """
+        Download one yearly NVD feed unless the cached copy is current.
+
+        Args:
+            session: Shared requests session
+            year: Feed year
+            feed_dir: Directory holding downloaded feeds
+
+        Returns:
+            Path to the gzipped feed file
+        """
+        feed_path = feed_dir / f"nvdcve-2.0-{year}.json.gz"
+        etag_path = feed_dir / f"nvdcve-2.0-{year}.etag"
+
+        # Conditional GET so an unchanged feed isn't transferred again
+        headers = {}
+        if feed_path.exists() and etag_path.exists():
+            headers['If-None-Match'] = etag_path.read_text().strip()
+
+        with session.get(NVD_FEED_URL.format(year=year), headers=headers, stream=True, timeout=60) as response:
+            if response.status_code == 304:
+                logger.info(f"NVD feed for {year} is unchanged")
+                return feed_path
+            response.raise_for_status()
+
+            partial_path = feed_path.with_suffix('.part')
+            with open(partial_path, 'wb') as f:
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    f.write(chunk)
+            partial_path.replace(feed_path)
+
+            etag = response.headers.get('ETag')
+            if etag:
+                etag_path.write_text(etag)
+
+        logger.info(f"Downloaded NVD feed for {year}")
+        return feed_path
+
+    def _read_nvd_feed(self, feed_path):
+        """
+        Stream the entries of a gzipped NVD feed in the database format.
+
+        Args:
+            feed_path: Path to the gzipped feed file
+
+        Returns:
+            Iterator of CVE entries for the supported vulnerability types
+        """
+        with gzip.open(feed_path, 'rb') as f:
+            if IJSON_AVAILABLE:
+                items = ijson.items(f, 'vulnerabilities.item', use_float=True)
+            else:
+                items = json.load(f).get('vulnerabilities', [])
+
+            for item in items:
+                cve = self._convert_nvd_item(item)
+                if cve:
+                    yield cve
+
+    @staticmethod
+    def _convert_nvd_item(item):
+        """
+        Convert an NVD feed item into a CVE database entry.
+
+        Args:
+            item: Dictionary from the feed's vulnerabilities list (2.0 schema)
+
+        Returns:
+            CVE entry dictionary, or None if its weakness type isn't tracked
+        """
+        cve = item.get('cve', {})
+
+        vuln_type = None
+        for weakness in cve.get('weaknesses', []):
+            for description in weakness.get('description', []):
+                vuln_type = CWE_VULN_TYPES.get(description.get('value'))
+                if vuln_type:
+                    break
+            if vuln_type:
+                break
+        if not vuln_type:
+            return None
+
+        # Affected vendors and products from the CPE match criteria
+        systems = set()
+        for configuration in cve.get('configurations', []):
+            for node in configuration.get('nodes', []):
+                for match in node.get('cpeMatch', []):
+                    parts = match.get('criteria', '').split(':')
+                    if len(parts) > 4:
+                        systems.update(part.replace('_', ' ') for part in parts[3:5])
+
+        # CVSS v3.1 score, else v3.0; the primary (NVD) assessment comes first
+        cvss = {}
+        metrics = cve.get('metrics', {})
+        for version in ('cvssMetricV31', 'cvssMetricV30'):
+            scores = sorted(metrics.get(version, []), key=lambda metric: metric.get('type') != 'Primary')
+            if scores:
+                cvss = scores[0].get('cvssData', {})
+                break
+
+        descriptions = cve.get('descriptions', [])
+        description = next(
+            (entry.get('value', '') for entry in descriptions if entry.get('lang') == 'en'),
+            descriptions[0].get('value', '') if descriptions else ''
+        )
+
+        return {
+            'cve_id': cve.get('id'),
+            'type': vuln_type,
+            'description': description,
+            'severity': cvss.get('baseSeverity', 'UNKNOWN').capitalize(),
+            'cvss_score': cvss.get('baseScore'),
+            'affected_systems': sorted(systems),
+            'references': [ref.get('url') for ref in cve.get('references', [])]
+        }
+
     def _generate_sample_cves(self):
         """
         Generate a sample CVE database for demonstration.
@@ -152,29 +462,61 @@ class CVEMatcher:
         Returns:
             List of related CVE entries
         """
-        # Map vulnerability types to CVE types
-        vuln_type_map = {
-            'SQLi': 'SQLi',
-            'XSS': 'XSS',
-            'RCE': 'RCE',
-            'LFI': 'LFI'
-        }
+        # Matching is case-insensitive, so normalize server_info before the
+        # cache lookup to let equivalent banners share an entry
+        server_key = server_info.lower().strip() if server_info else None
+        try:
+            return list(self._find_cves_cached(vuln_type, server_key))
+        except LookupError:
+            # Misses are never cached; an empty result may be filled by a database refresh
+            return []
+
+    def _match_cves_or_raise(self, vuln_type, server_info):
+        """
+        Match CVEs for the lookup cache, raising LookupError when nothing matches.
+
+        lru_cache does not store raised exceptions, so only hits are cached.
+
+        Args:
+            vuln_type: Type of vulnerability (SQLi, XSS, RCE, LFI)
+            server_info: Server information string, already lowercased and stripped
+
+        Returns:
+            Non-empty tuple of matching CVE entries
+        """
+        matching_cves = self._match_cves(vuln_type, server_info)
+        if not matching_cves:
+            raise LookupError(f"No CVEs match {vuln_type}")
+        return matching_cves
+
+    def _match_cves(self, vuln_type, server_info):
+        """
+        Scan the CVE database for entries matching a vulnerability.
+
+        Args:
+            vuln_type: Type of vulnerability (SQLi, XSS, RCE, LFI)
+            server_info: Server information string, already lowercased and stripped
+
+        Returns:
+            Tuple of at most 3 matching CVE entries
+        """
+        cve_type = VULN_TYPE_CVE_TYPES.get(vuln_type, vuln_type)
+        candidates = self._by_type.get(cve_type, ())
+
+        # If no server info, just match by type
+        if not server_info:
+            return tuple(entry[0] for entry in candidates[:3])
 
-        cve_type = vuln_type_map.get(vuln_type, vuln_type)
+        # Check if server type matches affected systems
+        server_tokens = _tokenize(server_info)
         matching_cves = []
+        for cve, system_tokens, system_phrases in candidates:
+            if not system_tokens.isdisjoint(server_tokens) or any(
+                phrase in server_info for phrase in system_phrases
+            ):
+                matching_cves.append(cve)
+                # Limit to top 3 most relevant CVEs
+                if len(matching_cves) == 3:
+                    break
 
-        # Find relevant CVEs
-        for cve in self.cve_data.get('cves', []):
-            if cve.get('type') == cve_type:
-                # Check if server type matches affected systems
-                if server_info:
-                    for system in cve.get('affected_systems', []):
-                        if system.lower() in server_info.lower():
-                            matching_cves.append(cve)
-                            break
-                else:
-                    # If no server info, just match by type
-                    matching_cves.append(cve)
-
-        # Limit to top 3 most relevant CVEs
-        return matching_cves[:3]
\ No newline at end of file
+        return tuple(matching_cves)
\ No newline at end of file
@@ -3,18 +3,57 @@
 Data parser module for converting various scan result formats into a standardized structure.
 """
 
-import pandas as pd
 import json
 import csv
+import itertools
 import logging
 import re
 from pathlib import Path
 
+# Faster JSON decoding when orjson is installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Incremental JSON decoding for large scan files when ijson is installed
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
 logger = logging.getLogger("deep_analytics.parser")
 
+# Patterns for generic text scan output, compiled once at import
+URL_PATTERN = re.compile(r'https?://\S+')
+STATUS_PATTERN = re.compile(r'\b(\d{3})\b')
+SERVER_PATTERN = re.compile(r'Server:\s*(\S+)')
+HEADER_PATTERN = re.compile(r'URL|Status|Server|SQLi|XSS|RCE', re.IGNORECASE)
+HEADER_FIELD_PATTERN = re.compile(r'\b(\w+)\b')
+SPACE_DELIMITED_HEADER_PATTERN = re.compile(r'URL\s+Status\s+Response')
+FLAG_PATTERNS = {
+    flag: re.compile(fr'\b{flag}\b.*?(True|False)', re.IGNORECASE)
+    for flag in ('SQLi', 'XSS', 'RCE', 'LFI')
+}
+
 class ScanDataParser:
     """Parser for various security scan result formats."""
 
+    # CSV and tab-delimited cells converted to booleans rather than kept as strings
+    BOOLEAN_STRINGS = {'true': True, 'false': False}
+
+    # Streaming parse method for each supported file extension
+    FORMAT_PARSERS = {
+        '.csv': '_iter_csv',
+        '.json': '_iter_json',
+        '.txt': '_iter_txt',
+    }
+
+    # JSON files smaller than this are decoded in one go rather than streamed
+    JSON_STREAM_MIN_SIZE = 1024 * 1024
+
     def parse_file(self, file_path):
         """
         Parse a scan results file based on its extension.
@@ -25,36 +64,80 @@ class ScanDataParser:
         Returns:
             List of dictionaries containing scan data
         """
+        return list(self.parse_file_iter(file_path))
+
+    def parse_file_iter(self, file_path):
+        """
+        Lazily parse a scan results file based on its extension.
+
+        Entries are yielded as they are read, so callers can start working
+        on the first targets before the rest of the file has been parsed.
+
+        Args:
+            file_path: Path to the scan results file
+
+        Returns:
+            Iterator of dictionaries containing scan data
+        """
         file_path = Path(file_path)
 
         if not file_path.exists():
             raise FileNotFoundError(f"Scan file not found: {file_path}")
 
         # Determine parsing method based on file extension
-        if file_path.suffix.lower() == '.csv':
-            return self.parse_csv(file_path)
-        elif file_path.suffix.lower() == '.json':
-            return self.parse_json(file_path)
-        elif file_path.suffix.lower() == '.txt':
-            return self.parse_txt(file_path)
-        else:
+        method_name = self.FORMAT_PARSERS.get(file_path.suffix.lower())
+        if method_name is None:
             raise ValueError(f"Unsupported file format: {file_path.suffix}")
+        return getattr(self, method_name)(file_path)
 
     def parse_csv(self, file_path):
         """Parse a CSV scan results file."""
+        return list(self._iter_csv(file_path))
+
+    def _iter_csv(self, file_path):
+        """Yield CSV rows as dictionaries, one row at a time."""
         try:
-            df = pd.read_csv(file_path)
-            # Convert DataFrame to list of dictionaries
-            return df.to_dict('records')
+            with open(file_path, 'r', newline='') as f:
+                for row in csv.DictReader(f):
+                    # Empty cells are treated as missing, like NaN was
+                    yield {
+                        key: self._coerce_csv_value(value)
+                        for key, value in row.items()
+                        if value
+                    }
         except Exception as e:
             logger.error(f"Error parsing CSV file: {str(e)}")
             raise
 
+    def _coerce_csv_value(self, value):
+        """Convert a CSV cell to a boolean or number where it looks like one."""
+        if not isinstance(value, str):
+            # Surplus cells collected by DictReader under its restkey
+            return value
+
+        flag = self.BOOLEAN_STRINGS.get(value.lower())
+        if flag is not None:
+            return flag
+
+        try:
+            return int(value)
+        except ValueError:
+            pass
+
+        try:
+            return float(value)
+        except ValueError:
+            return value
+
     def parse_json(self, file_path):
         """Parse a JSON scan results file."""
         try:
-            with open(file_path, 'r') as f:
-                data = json.load(f)
+            if ORJSON_AVAILABLE:
+                with open(file_path, 'rb') as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(file_path, 'r') as f:
+                    data = json.load(f)
 
             # Handle different JSON structures
             if isinstance(data, list):
@@ -67,158 +150,170 @@ class ScanDataParser:
             logger.error(f"Error parsing JSON file: {str(e)}")
             raise
 
+    def _iter_json(self, file_path):
+        """Yield JSON scan entries, streaming large files with ijson."""
+        if not IJSON_AVAILABLE or file_path.stat().st_size < self.JSON_STREAM_MIN_SIZE:
+            yield from self.parse_json(file_path)
+            return
+
+        try:
+            with open(file_path, 'rb') as f:
+                # Peek at the top-level value to pick the prefix to stream
+                head = f.read(64).lstrip()
+                f.seek(0)
+
+                if head.startswith(b'['):
+                    yield from ijson.items(f, 'item', use_float=True)
+                    return
+
+                streamed = False
+                if head.startswith(b'{'):
+                    for entry in ijson.items(f, 'results.item', use_float=True):
+                        streamed = True
+                        yield entry
+        except Exception as e:
+            logger.error(f"Error parsing JSON file: {str(e)}")
+            raise
+
+        # Not a results list (or an empty one); let parse_json decide the shape
+        if not streamed:
+            yield from self.parse_json(file_path)
+
     def parse_txt(self, file_path):
         """
         Parse a text-based scan results file.
         Handles tab-delimited, space-delimited, and custom formats.
         """
+        return list(self._iter_txt(file_path))
+
+    def _iter_txt(self, file_path):
+        """Yield entries from a text file using the parser for its format."""
         try:
-            with open(file_path, 'r') as f:
-                content = f.read()
-
-            # Try to detect format
-            if '\t' in content.split('\n')[0]:
-                return self._parse_tab_delimited(file_path)
-            elif re.search(r'URL\s+Status\s+Response', content):
-                return self._parse_space_delimited(file_path)
-            else:
-                # Try general parsing approach
-                return self._parse_generic_txt(file_path)
+            # Read the file once; format detection and parsing share the lines
+            content = Path(file_path).read_text(encoding='utf-8', errors='replace')
+            lines = content.splitlines()
+            yield from self._detect_txt_parser(content, lines)(lines)
         except Exception as e:
             logger.error(f"Error parsing TXT file: {str(e)}")
             raise
 
-    def _parse_tab_delimited(self, file_path):
-        """Parse a tab-delimited text file."""
-        results = []
-        with open(file_path, 'r') as f:
-            # Read header line
-            header = next(f).strip().split('\t')
-
-            # Process each line
-            for line in f:
-                if not line.strip():
-                    continue
-
-                values = line.strip().split('\t')
-                if len(values) < len(header):
-                    # Pad with empty values if needed
-                    values.extend([''] * (len(header) - len(values)))
-                elif len(values) > len(header):
-                    # Truncate if too many values
-                    values = values[:len(header)]
-
-                # Create dictionary from header and values
-                entry = {}
-                for i, field in enumerate(header):
-                    # Handle boolean fields
-                    if values[i].lower() in ('true', 'false'):
-                        entry[field] = values[i].lower() == 'true'
-                    else:
-                        entry[field] = values[i]
-
-                results.append(entry)
-
-        return results
-
-    def _parse_space_delimited(self, file_path):
-        """Parse a space-delimited text file with fixed width columns."""
-        results = []
-        with open(file_path, 'r') as f:
-            content = f.readlines()
-
-            # Extract header and determine column positions
-            header_line = content[0]
-            column_positions = []
-            header_fields = []
-
-            # Find the starting positions of each column
-            for match in re.finditer(r'\S+\s+', header_line):
-                column_positions.append(match.start())
-                header_fields.append(match.group().strip())
-
-            # Add the last column
-            last_match = re.search(r'\S+$', header_line)
-            if last_match:
-                column_positions.append(last_match.start())
-                header_fields.append(last_match.group())
-
-            # Process each data line
-            for line in content[1:]:
-                if not line.strip():
-                    continue
-
-                # Extract values based on column positions
-                entry = {}
-                for i in range(len(column_positions)):
-                    start = column_positions[i]
-                    end = column_positions[i+1] if i+1 < len(column_positions) else None
-                    value = line[start:end].strip() if end else line[start:].strip()
-
-                    # Handle boolean fields
-                    if value.lower() in ('true', 'false'):
-                        entry[header_fields[i]] = value.lower() == 'true'
-                    else:
-                        entry[header_fields[i]] = value
-
-                results.append(entry)
-
-        return results
-
-    def _parse_generic_txt(self, file_path):
+    def _detect_txt_parser(self, content, lines):
+        """Return the parsing method matching a text file's format."""
+        # Try to detect format
+        if lines and '\t' in lines[0]:
+            return self._parse_tab_delimited
+        elif SPACE_DELIMITED_HEADER_PATTERN.search(content):
+            return self._parse_space_delimited
+        else:
+            # Try general parsing approach
+            return self._parse_generic_txt
+
+    def _parse_tab_delimited(self, lines):
+        """Parse tab-delimited text lines, yielding one entry per line."""
+        # Read header line
+        header = lines[0].strip().split('\t')
+        padding = [''] * len(header)
+        booleans = self.BOOLEAN_STRINGS
+
+        # Process each line
+        for line in itertools.islice(lines, 1, None):
+            line = line.strip()
+            if not line:
+                continue
+
+            # Pad with empty values if needed; zip truncates extra values
+            values = line.split('\t')
+            if len(values) < len(header):
+                values += padding[len(values):]
+
+            # Create dictionary from header and values, handling boolean fields
+            yield {
+                field: booleans.get(value.lower(), value)
+                for field, value in zip(header, values)
+            }
+
+    def _parse_space_delimited(self, lines):
+        """Parse space-delimited text lines with fixed width columns."""
+        # Extract header and determine column positions
+        header_line = lines[0] if lines else ''
+        column_positions = []
+        header_fields = []
+
+        # Find the starting positions of each column
+        for match in re.finditer(r'\S+\s+', header_line):
+            column_positions.append(match.start())
+            header_fields.append(match.group().strip())
+
+        # Add the last column
+        last_match = re.search(r'\S+$', header_line)
+        if last_match:
+            column_positions.append(last_match.start())
+            header_fields.append(last_match.group())
+
+        # Column bounds are fixed by the header, so slice them once
+        column_slices = [
+            slice(start, end)
+            for start, end in zip(column_positions, column_positions[1:] + [None])
+        ]
+        booleans = self.BOOLEAN_STRINGS
+
+        # Process each data line
+        for line in itertools.islice(lines, 1, None):
+            if not line.strip():
+                continue
+
+            # Extract values based on column positions, handling boolean fields
+            values = [line[bounds].strip() for bounds in column_slices]
+            yield {
+                field: booleans.get(value.lower(), value)
+                for field, value in zip(header_fields, values)
+            }
+
+    def _parse_generic_txt(self, lines):
         """
-        Parse a generic text file format.
+        Parse generic text lines.
         Tries to detect the format and extract relevant information.
         """
-        results = []
-        url_pattern = r'https?://\S+'
-
-        with open(file_path, 'r') as f:
-            lines = f.readlines()
-
-            # Skip empty lines
-            lines = [line.strip() for line in lines if line.strip()]
-
-            # Detect header line
-            header_line = lines[0] if lines else ""
-            header_fields = []
-
-            # Try to extract header fields
-            if re.search(r'URL|Status|Server|SQLi|XSS|RCE', header_line, re.IGNORECASE):
-                header_fields = re.findall(r'\b(\w+)\b', header_line)
-                lines = lines[1:]  # Skip header line
-
-            # Process each line
-            for line in lines:
-                # Extract URL
-                url_match = re.search(url_pattern, line)
-                if not url_match:
-                    continue
-
-                url = url_match.group(0)
-
-                # Extract other fields
-                entry = {'URL': url}
-
-                # Status code
-                status_match = re.search(r'\b(\d{3})\b', line[url_match.end():])
-                if status_match:
-                    entry['Status'] = status_match.group(1)
-
-                # Server type
-                server_match = re.search(r'Server:\s*(\S+)', line)
-                if server_match:
-                    entry['Server'] = server_match.group(1)
-
-                # Boolean flags
-                for flag in ['SQLi', 'XSS', 'RCE', 'LFI']:
-                    if re.search(fr'\b{flag}\b.*?(True|False)', line, re.IGNORECASE):
-                        value_match = re.search(fr'\b{flag}\b.*?(True|False)', line, re.IGNORECASE)
-                        entry[flag] = value_match.group(1).lower() == 'true'
-                    else:
-                        # Default to False if not found
-                        entry[flag] = False
-
-                results.append(entry)
-
-        return results
\ No newline at end of file
+        # Skip empty lines
+        lines = (line.strip() for line in lines if line.strip())
+
+        # Detect header line
+        header_line = next(lines, "")
+        header_fields = []
+
+        # Try to extract header fields
+        if HEADER_PATTERN.search(header_line):
+            header_fields = HEADER_FIELD_PATTERN.findall(header_line)
+        else:
+            # Not a header, so parse it as data
+            lines = itertools.chain([header_line], lines)
+
+        # Process each line
+        for line in lines:
+            # Extract URL
+            url_match = URL_PATTERN.search(line)
+            if not url_match:
+                continue
+
+            url = url_match.group(0)
+
+            # Extract other fields
+            entry = {'URL': url}
+
+            # Status code
+            status_match = STATUS_PATTERN.search(line[url_match.end():])
+            if status_match:
+                entry['Status'] = status_match.group(1)
+
+            # Server type
+            server_match = SERVER_PATTERN.search(line)
+            if server_match:
+                entry['Server'] = server_match.group(1)
+
+            # Boolean flags
+            for flag, flag_pattern in FLAG_PATTERNS.items():
+                value_match = flag_pattern.search(line)
+                # Default to False if not found
+                entry[flag] = bool(value_match) and value_match.group(1).lower() == 'true'
+
+            yield entry
\ No newline at end of file
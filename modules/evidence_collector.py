@@ -4,20 +4,101 @@ Evidence collector module for gathering proof of vulnerabilities.
 """
 
 import logging
-import requests
 import os
 import datetime
 import json
 import base64
+import gzip
+import hashlib
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
 
+# Faster JSON encoding when orjson is installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# HTTP/2 client for evidence requests when httpx is installed
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
 logger = logging.getLogger("deep_analytics.evidence")
 
+# Evidence settings keyed by a substring of the analyzer's vulnerability type
+EVIDENCE_SPECS = {
+    'SQL Injection': {
+        'prefix': 'sqli',
+        'default_payload': "id=1' OR '1'='1",
+        'label': 'SQL Injection',
+        'notes': "Evidence of SQL injection vulnerability. Look for database error messages or unexpected data in the response."
+    },
+    'Cross-Site Scripting': {
+        'prefix': 'xss',
+        'default_payload': "name=<script>alert('XSS')</script>",
+        'label': 'Cross-Site Scripting (XSS)',
+        'notes': "Evidence of XSS vulnerability. Look for unescaped script tags or event handlers in the response."
+    },
+    'Remote Code Execution': {
+        'prefix': 'rce',
+        'default_payload': "cmd=cat+/etc/passwd",
+        'label': 'Remote Code Execution (RCE)',
+        'notes': "Evidence of RCE vulnerability. Look for command output or system information in the response."
+    },
+    'Local File Inclusion': {
+        'prefix': 'lfi',
+        'default_payload': "file=../../../etc/passwd",
+        'label': 'Local File Inclusion (LFI)',
+        'notes': "Evidence of LFI vulnerability. Look for file contents in the response."
+    }
+}
+
+# Finds whichever EVIDENCE_SPECS key a vulnerability type contains in one scan
+EVIDENCE_SPEC_PATTERN = re.compile('|'.join(map(re.escape, EVIDENCE_SPECS)))
+
+# Value assigned on the first PoC line containing "payload =", taken after
+# that line's first '='
+PAYLOAD_LINE_PATTERN = re.compile(r'^(?=.*payload =)[^=\n]*=(.*)$', re.MULTILINE)
+
+# Characters in a URL that aren't safe in a directory name
+TARGET_DIR_TRANSLATION = str.maketrans({
+    ':': '_', '/': '_', '?': '_', '&': '_', '=': '_', '#': '_',
+})
+
+
+@lru_cache(maxsize=1024)
+def _parse_base_url(url):
+    """Parse a target URL and its query parameters once for all of its payloads."""
+    parsed_url = urlparse(url)
+    return parsed_url, parse_qs(parsed_url.query)
+
+
 class EvidenceCollector:
     """Collects evidence of security vulnerabilities."""
 
-    def __init__(self, output_dir="./evidence", capture_screenshots=False, save_http=True):
+    # Evidence files smaller than this are left uncompressed
+    GZIP_MIN_SIZE = 2048
+
+    # Headers sent with every evidence request
+    DEFAULT_HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/91.0.4472.124 Safari/537.36',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.5',
+        'Connection': 'keep-alive'
+    }
+    # The same headers as they appear in the recorded request
+    DEFAULT_HEADER_LINES = ''.join(f"{key}: {value}\n" for key, value in DEFAULT_HEADERS.items())
+
+    def __init__(self, output_dir="./evidence", capture_screenshots=False, save_http=True,
+                 compress_evidence=True):
         """
         Initialize the evidence collector.
 
@@ -25,34 +106,31 @@ class EvidenceCollector:
             output_dir: Directory to save evidence files
             capture_screenshots: Whether to capture screenshots of vulnerable pages
             save_http: Whether to save HTTP request/response data
+            compress_evidence: Whether to gzip evidence files of GZIP_MIN_SIZE bytes or more
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True, parents=True)
         self.capture_screenshots = capture_screenshots
         self.save_http = save_http
+        self.compress_evidence = compress_evidence
+        # The browser is shared by all evidence collection threads
+        self._browser_lock = threading.Lock()
 
-        # Initialize screenshot capability if requested
-        if self.capture_screenshots:
-            try:
-                # Only import if needed
-                from selenium import webdriver
-                from selenium.webdriver.chrome.options import Options
-
-                # Set up headless browser
-                chrome_options = Options()
-                chrome_options.add_argument("--headless")
-                chrome_options.add_argument("--no-sandbox")
-                chrome_options.add_argument("--disable-dev-shm-usage")
-                chrome_options.add_argument("--disable-gpu")
-
-                self.browser = webdriver.Chrome(options=chrome_options)
-                logger.info("Screenshot capability initialized")
-            except ImportError:
-                logger.warning("Selenium not installed. Screenshots will not be captured.")
-                self.capture_screenshots = False
-            except Exception as e:
-                logger.warning(f"Error initializing browser for screenshots: {str(e)}")
-                self.capture_screenshots = False
+        # Evidence directory for each target URL, and every directory created
+        self._target_dirs = {}
+        self._known_dirs = {self.output_dir}
+
+        # HTTP session shared by all evidence requests, created on first use
+        self._session = None
+        self._session_lock = threading.Lock()
+
+        # Headless browser for screenshots, started on the first capture
+        self.browser = None
+
+        # Manifests are written in the background so the caller's thread can
+        # move on to the next target's requests while the disk catches up; a
+        # single writer keeps writes to the same manifest in submission order
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="evidence-writer")
 
     def collect_evidence(self, url, vulnerabilities):
         """
@@ -65,60 +143,87 @@ class EvidenceCollector:
         Returns:
             List of evidence dictionaries
         """
-        evidence = []
+        if not vulnerabilities:
+            return []
 
         # Create a directory for this target
         target_dir = self._create_target_dir(url)
 
-        # For each vulnerability, collect specific evidence
-        for vuln in vulnerabilities:
-            vuln_type = vuln['type']
-
-            # Generate evidence based on vulnerability type
-            if 'SQL Injection' in vuln_type:
-                evidence.append(self._collect_sqli_evidence(url, vuln, target_dir))
-            elif 'Cross-Site Scripting' in vuln_type:
-                evidence.append(self._collect_xss_evidence(url, vuln, target_dir))
-            elif 'Remote Code Execution' in vuln_type:
-                evidence.append(self._collect_rce_evidence(url, vuln, target_dir))
-            elif 'Local File Inclusion' in vuln_type:
-                evidence.append(self._collect_lfi_evidence(url, vuln, target_dir))
-            else:
-                # Generic evidence collection
-                evidence.append(self._collect_generic_evidence(url, vuln, target_dir))
+        # One timestamp for the whole batch, formatted once for records and filenames
+        collected_at = datetime.datetime.now()
+        timestamp = collected_at.isoformat()
+        file_stamp = collected_at.strftime("%Y%m%d_%H%M%S")
+
+        # URLs differing only in their query share a directory, so files are
+        # named per URL as well
+        url_digest = hashlib.sha1(url.encode('utf-8')).hexdigest()[:12]
+
+        # Each vulnerability's evidence is an independent HTTP round trip,
+        # so collect them concurrently and keep the results in order
+        with ThreadPoolExecutor(max_workers=len(vulnerabilities)) as executor:
+            futures = []
+            for index, vuln in enumerate(vulnerabilities, 1):
+                # Pick evidence settings based on vulnerability type; generic if none match
+                match = EVIDENCE_SPEC_PATTERN.search(vuln['type'])
+                spec = EVIDENCE_SPECS[match.group()] if match else None
+                futures.append(executor.submit(
+                    self._collect_vulnerability_evidence,
+                    url, vuln, target_dir, spec, timestamp,
+                    f"{file_stamp}_{url_digest}_{index}"
+                ))
+
+            evidence = [future.result() for future in futures]
+
+        # Save all of the target's evidence to a single manifest file
+        self._writer.submit(self._write_manifest, target_dir / f"evidence_{url_digest}.json", evidence)
 
         return evidence
 
     def _create_target_dir(self, url):
         """Create a directory for the target's evidence."""
+        target_dir = self._target_dirs.get(url)
+        if target_dir is not None:
+            return target_dir
+
         # Sanitize URL for filesystem
-        parsed_url = urlparse(url)
-        hostname = parsed_url.netloc.replace(':', '_')
-        path = parsed_url.path.replace('/', '_')
-        if not path:
-            path = '_root_'
+        parsed_url, _ = _parse_base_url(url)
+        dir_name = f"{parsed_url.netloc}{parsed_url.path or '_root_'}".translate(TARGET_DIR_TRANSLATION)
 
-        # Create target directory
-        target_dir = self.output_dir / f"{hostname}{path}"
-        target_dir.mkdir(exist_ok=True, parents=True)
+        # Create target directory, unless another URL already mapped to it
+        target_dir = self.output_dir / dir_name
+        if target_dir not in self._known_dirs:
+            target_dir.mkdir(exist_ok=True, parents=True)
+            self._known_dirs.add(target_dir)
 
+        self._target_dirs[url] = target_dir
         return target_dir
 
-    def _collect_sqli_evidence(self, url, vulnerability, target_dir):
-        """Collect evidence for SQL Injection vulnerability."""
-        # Extract PoC from vulnerability
-        poc_lines = vulnerability['proof_of_concept'].strip().split('\n')
-        payload = None
-        for line in poc_lines:
-            if 'payload =' in line:
-                payload = line.split('=', 1)[1].strip().strip('"\'')
-                break
+    def _collect_vulnerability_evidence(self, url, vulnerability, target_dir, spec, timestamp, file_tag):
+        """
+        Collect evidence for a single vulnerability.
+
+        Args:
+            url: Target URL
+            vulnerability: Vulnerability dictionary
+            target_dir: Directory for the target's evidence
+            spec: Entry from EVIDENCE_SPECS, or None for generic evidence
+            timestamp: ISO timestamp recorded in the evidence
+            file_tag: Batch timestamp, URL digest and index used in the screenshot filename
 
-        if not payload:
-            payload = "id=1' OR '1'='1"
+        Returns:
+            Evidence dictionary
+        """
+        vuln_type = vulnerability['type']
 
-        # Craft test URL with payload
-        test_url = self._create_test_url(url, payload)
+        if spec:
+            prefix = spec['prefix']
+            # Extract PoC payload from vulnerability
+            payload = self._extract_payload(vulnerability['proof_of_concept']) or spec['default_payload']
+            # Craft test URL with payload
+            test_url = self._create_test_url(url, payload)
+        else:
+            prefix = 'generic'
+            test_url = url
 
         # Collect HTTP evidence
         http_evidence = self._capture_http_interaction(test_url)
@@ -126,173 +231,72 @@ class EvidenceCollector:
         # Capture screenshot if enabled
         screenshot_path = None
         if self.capture_screenshots:
-            screenshot_path = self._capture_screenshot(test_url, target_dir, 'sqli')
+            screenshot_path = self._capture_screenshot(test_url, target_dir, prefix, file_tag)
 
-        # Save evidence to file
-        evidence_file = target_dir / "sqli_evidence.json"
+        # Build the evidence record; collect_evidence saves the whole batch
         evidence_data = {
-            'timestamp': datetime.datetime.now().isoformat(),
-            'vulnerability_type': 'SQL Injection',
-            'target_url': url,
-            'test_url': test_url,
-            'payload': payload,
-            'http_request': http_evidence['request'],
-            'http_response': http_evidence['response'],
-            'screenshot_path': str(screenshot_path) if screenshot_path else None,
-            'notes': "Evidence of SQL injection vulnerability. Look for database error messages or unexpected data in the response."
+            'timestamp': timestamp,
+            'vulnerability_type': spec['label'] if spec else vuln_type,
+            'target_url': url
         }
-
-        with open(evidence_file, 'w') as f:
-            json.dump(evidence_data, f, indent=2)
-
-        return evidence_data
-
-    def _collect_xss_evidence(self, url, vulnerability, target_dir):
-        """Collect evidence for XSS vulnerability."""
-        # Implementation similar to _collect_sqli_evidence
-        poc_lines = vulnerability['proof_of_concept'].strip().split('\n')
-        payload = None
-        for line in poc_lines:
-            if 'payload =' in line:
-                payload = line.split('=', 1)[1].strip().strip('"\'')
-                break
-
-        if not payload:
-            payload = "name=<script>alert('XSS')</script>"
-
-        test_url = self._create_test_url(url, payload)
-        http_evidence = self._capture_http_interaction(test_url)
-
-        screenshot_path = None
-        if self.capture_screenshots:
-            screenshot_path = self._capture_screenshot(test_url, target_dir, 'xss')
-
-        evidence_file = target_dir / "xss_evidence.json"
-        evidence_data = {
-            'timestamp': datetime.datetime.now().isoformat(),
-            'vulnerability_type': 'Cross-Site Scripting (XSS)',
-            'target_url': url,
-            'test_url': test_url,
-            'payload': payload,
+        if spec:
+            evidence_data['test_url'] = test_url
+            evidence_data['payload'] = payload
+        evidence_data.update({
             'http_request': http_evidence['request'],
             'http_response': http_evidence['response'],
             'screenshot_path': str(screenshot_path) if screenshot_path else None,
-            'notes': "Evidence of XSS vulnerability. Look for unescaped script tags or event handlers in the response."
-        }
-
-        with open(evidence_file, 'w') as f:
-            json.dump(evidence_data, f, indent=2)
+            'notes': spec['notes'] if spec else f"Evidence of {vuln_type} vulnerability."
+        })
 
         return evidence_data
 
-    def _collect_rce_evidence(self, url, vulnerability, target_dir):
-        """Collect evidence for RCE vulnerability."""
-        # Implementation similar to _collect_sqli_evidence
-        poc_lines = vulnerability['proof_of_concept'].strip().split('\n')
-        payload = None
-        for line in poc_lines:
-            if 'payload =' in line:
-                payload = line.split('=', 1)[1].strip().strip('"\'')
-                break
-
-        if not payload:
-            payload = "cmd=cat+/etc/passwd"
-
-        test_url = self._create_test_url(url, payload)
-        http_evidence = self._capture_http_interaction(test_url)
-
-        screenshot_path = None
-        if self.capture_screenshots:
-            screenshot_path = self._capture_screenshot(test_url, target_dir, 'rce')
+    def _extract_payload(self, proof_of_concept):
+        """Return the payload assigned in a PoC script, or None if there is none."""
+        match = PAYLOAD_LINE_PATTERN.search(proof_of_concept)
+        if match:
+            return match.group(1).strip().strip('"\'')
+        return None
 
-        evidence_file = target_dir / "rce_evidence.json"
-        evidence_data = {
-            'timestamp': datetime.datetime.now().isoformat(),
-            'vulnerability_type': 'Remote Code Execution (RCE)',
-            'target_url': url,
-            'test_url': test_url,
-            'payload': payload,
-            'http_request': http_evidence['request'],
-            'http_response': http_evidence['response'],
-            'screenshot_path': str(screenshot_path) if screenshot_path else None,
-            'notes': "Evidence of RCE vulnerability. Look for command output or system information in the response."
-        }
-
-        with open(evidence_file, 'w') as f:
-            json.dump(evidence_data, f, indent=2)
-
-        return evidence_data
-
-    def _collect_lfi_evidence(self, url, vulnerability, target_dir):
-        """Collect evidence for LFI vulnerability."""
-        # Implementation similar to _collect_sqli_evidence
-        poc_lines = vulnerability['proof_of_concept'].strip().split('\n')
-        payload = None
-        for line in poc_lines:
-            if 'payload =' in line:
-                payload = line.split('=', 1)[1].strip().strip('"\'')
-                break
-
-        if not payload:
-            payload = "file=../../../etc/passwd"
-
-        test_url = self._create_test_url(url, payload)
-        http_evidence = self._capture_http_interaction(test_url)
-
-        screenshot_path = None
-        if self.capture_screenshots:
-            screenshot_path = self._capture_screenshot(test_url, target_dir, 'lfi')
-
-        evidence_file = target_dir / "lfi_evidence.json"
-        evidence_data = {
-            'timestamp': datetime.datetime.now().isoformat(),
-            'vulnerability_type': 'Local File Inclusion (LFI)',
-            'target_url': url,
-            'test_url': test_url,
-            'payload': payload,
-            'http_request': http_evidence['request'],
-            'http_response': http_evidence['response'],
-            'screenshot_path': str(screenshot_path) if screenshot_path else None,
-            'notes': "Evidence of LFI vulnerability. Look for file contents in the response."
-        }
-
-        with open(evidence_file, 'w') as f:
-            json.dump(evidence_data, f, indent=2)
-
-        return evidence_data
-
-    def _collect_generic_evidence(self, url, vulnerability, target_dir):
-        """Collect generic evidence for any vulnerability type."""
-        # Extract information from vulnerability
-        vuln_type = vulnerability['type']
+    def _write_manifest(self, path, evidence):
+        """Write a target's evidence manifest, logging rather than raising on failure."""
+        try:
+            self._write_json(path, evidence)
+        except Exception as e:
+            logger.error(f"Error saving evidence manifest {path}: {str(e)}")
 
-        # Use a generic payload
-        payload = "param=test"
+    def _write_json(self, path, data):
+        """
+        Write evidence data to a JSON file, gzipped as <path>.gz when large enough.
 
-        # Collect HTTP evidence
-        http_evidence = self._capture_http_interaction(url)
+        Args:
+            path: Path of the evidence file
+            data: Data to serialize
 
-        # Capture screenshot if enabled
-        screenshot_path = None
-        if self.capture_screenshots:
-            screenshot_path = self._capture_screenshot(url, target_dir, 'generic')
+        Returns:
+            Path of the file written
+        """
+        if ORJSON_AVAILABLE:
+            content = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        else:
+            content = json.dumps(data, indent=2).encode('utf-8')
 
-        # Save evidence to file
-        evidence_file = target_dir / "generic_evidence.json"
-        evidence_data = {
-            'timestamp': datetime.datetime.now().isoformat(),
-            'vulnerability_type': vuln_type,
-            'target_url': url,
-            'http_request': http_evidence['request'],
-            'http_response': http_evidence['response'],
-            'screenshot_path': str(screenshot_path) if screenshot_path else None,
-            'notes': f"Evidence of {vuln_type} vulnerability."
-        }
+        # HTTP headers and bodies compress well; fast deflate keeps the CPU cost low
+        gz_path = path.with_name(f"{path.name}.gz")
+        if self.compress_evidence and len(content) >= self.GZIP_MIN_SIZE:
+            path, stale_path = gz_path, path
+            content = gzip.compress(content, compresslevel=1)
+        else:
+            stale_path = gz_path
 
-        with open(evidence_file, 'w') as f:
-            json.dump(evidence_data, f, indent=2)
+        # Write to a temporary file and swap it in, so readers never see a partial manifest
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(content)
+        os.replace(tmp_path, path)
 
-        return evidence_data
+        # Drop the other variant left by an earlier run, which is now out of date
+        stale_path.unlink(missing_ok=True)
+        return path
 
     def _create_test_url(self, url, payload):
         """
@@ -305,21 +309,18 @@ class EvidenceCollector:
         Returns:
             URL with payload added
         """
-        # Parse the URL
-        parsed_url = urlparse(url)
+        # Parse the URL and get existing parameters (cached per target URL)
+        parsed_url, base_params = _parse_base_url(url)
 
         # Extract payload parameter and value
-        payload_parts = payload.split('=', 1)
-        if len(payload_parts) == 2:
-            param_name = payload_parts[0]
-            param_value = payload_parts[1]
-        else:
+        param_name, separator, param_value = payload.partition('=')
+        if not separator:
             # Default to 'id' parameter if no parameter name in payload
             param_name = 'id'
             param_value = payload
 
-        # Get existing parameters
-        params = parse_qs(parsed_url.query)
+        # Copy so the cached parameters stay untouched
+        params = dict(base_params)
 
         # Add or replace parameter
         params[param_name] = [param_value]
@@ -353,34 +354,36 @@ class EvidenceCollector:
             # Parse URL for request details
             parsed_url = urlparse(url)
 
-            # Prepare the request (but don't send it yet)
-            session = requests.Session()
-            request = requests.Request('GET', url)
-            prepared_request = request.prepare()
-
             # Capture request details
-            request_details = f"GET {parsed_url.path}?{parsed_url.query} HTTP/1.1\n"
-            request_details += f"Host: {parsed_url.netloc}\n"
-            request_details += "User-Agent: Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/91.0.4472.124 Safari/537.36\n"
-            request_details += "Accept: text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8\n"
-            request_details += "Accept-Language: en-US,en;q=0.5\n"
-            request_details += "Connection: keep-alive\n"
-
-            # Send the request and capture response
-            response = session.send(prepared_request, timeout=10)
+            request_details = (
+                f"GET {parsed_url.path}?{parsed_url.query} HTTP/1.1\n"
+                f"Host: {parsed_url.netloc}\n"
+                f"{self.DEFAULT_HEADER_LINES}"
+            )
+
+            # Send the request over the pooled client, reading only the part
+            # of the body kept in the evidence (limit to 5000 characters to
+            # avoid excessive size); a character is at most 4 bytes, so one
+            # byte more than that marks truncation
+            max_body_length = 5000
+            status_line, headers, raw_body, encoding = self._fetch(url, max_body_length * 4 + 1)
 
             # Capture response details
-            response_details = f"HTTP/1.1 {response.status_code} {response.reason}\n"
-            for key, value in response.headers.items():
-                response_details += f"{key}: {value}\n"
-            response_details += "\n"
-
-            # Add response body (limit to 5000 characters to avoid excessive size)
-            max_body_length = 5000
-            response_body = response.text[:max_body_length]
-            if len(response.text) > max_body_length:
-                response_body += f"\n... (truncated, total length: {len(response.text)} characters)"
-            response_details += response_body
+            response_lines = [status_line]
+            response_lines.extend(f"{key}: {value}" for key, value in headers.items())
+            response_lines.append("")
+
+            # Add response body
+            body_text = raw_body.decode(encoding or 'utf-8', errors='replace')
+            response_body = body_text[:max_body_length]
+            if len(body_text) > max_body_length:
+                total_length = headers.get('Content-Length')
+                if total_length:
+                    response_body += f"\n... (truncated, total length: {total_length} bytes)"
+                else:
+                    response_body += "\n... (truncated)"
+            response_lines.append(response_body)
+            response_details = "\n".join(response_lines)
 
             return {
                 'request': request_details,
@@ -394,7 +397,118 @@ class EvidenceCollector:
                 'response': f"Error: {str(e)}"
             }
 
-    def _capture_screenshot(self, url, target_dir, prefix):
+    def _fetch(self, url, max_bytes):
+        """
+        Send a GET request and read at most max_bytes of the decoded body.
+
+        Args:
+            url: URL to request
+            max_bytes: Maximum number of body bytes to read
+
+        Returns:
+            Tuple of (status line, response headers, body bytes, body encoding)
+        """
+        client = self._get_session()
+
+        if HTTPX_AVAILABLE:
+            with client.stream('GET', url, headers=self.DEFAULT_HEADERS) as response:
+                body = bytearray()
+                for chunk in response.iter_bytes():
+                    body += chunk
+                    if len(body) >= max_bytes:
+                        break
+                status_line = f"{response.http_version} {response.status_code} {response.reason_phrase}"
+                return status_line, response.headers, bytes(body[:max_bytes]), response.encoding
+
+        with client.get(url, headers=self.DEFAULT_HEADERS, timeout=10, stream=True) as response:
+            status_line = f"HTTP/1.1 {response.status_code} {response.reason}"
+            body = response.raw.read(max_bytes, decode_content=True)
+            return status_line, response.headers, body, response.encoding
+
+    def _get_session(self):
+        """
+        Return the shared HTTP client, creating it on first use.
+
+        Returns:
+            httpx.Client multiplexing over HTTP/2 when httpx is installed,
+            otherwise a requests.Session; both pooled for concurrent captures
+        """
+        with self._session_lock:
+            if self._session is None:
+                self._session = self._create_http_client()
+            return self._session
+
+    def _create_http_client(self):
+        """Create the pooled HTTP client used for evidence requests."""
+        if HTTPX_AVAILABLE:
+            limits = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+            try:
+                return httpx.Client(http2=True, timeout=10, limits=limits, follow_redirects=True)
+            except ImportError:
+                # HTTP/2 needs the h2 package; still reuse httpx's pool over HTTP/1.1
+                logger.debug("h2 not installed. Evidence requests will use HTTP/1.1.")
+                return httpx.Client(timeout=10, limits=limits, follow_redirects=True)
+
+        # Only import if needed
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def _ensure_browser(self):
+        """
+        Start the headless browser on first use.
+
+        Must be called with the browser lock held. Disables screenshots if the
+        browser can't be started.
+
+        Returns:
+            Boolean indicating if the browser is available
+        """
+        if self.browser is not None:
+            return True
+
+        try:
+            # Only import if needed
+            from selenium import webdriver
+            from selenium.webdriver.chrome.options import Options
+
+            # Set up headless browser
+            chrome_options = Options()
+            chrome_options.add_argument("--headless")
+            chrome_options.add_argument("--no-sandbox")
+            chrome_options.add_argument("--disable-dev-shm-usage")
+            chrome_options.add_argument("--disable-gpu")
+            # Screenshot once the DOM is ready instead of waiting for every subresource
+            chrome_options.page_load_strategy = 'eager'
+
+            self.browser = webdriver.Chrome(options=chrome_options)
+            self.browser.set_page_load_timeout(8)
+
+            # Skip images, stylesheets and fonts; evidence is about the page content
+            try:
+                self.browser.execute_cdp_cmd('Network.enable', {})
+                self.browser.execute_cdp_cmd('Network.setBlockedURLs', {
+                    'urls': ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.css', '*.woff*']
+                })
+            except Exception as e:
+                logger.debug("Could not block static resources for screenshots: %s", e)
+
+            logger.info("Screenshot capability initialized")
+            return True
+        except ImportError:
+            logger.warning("Selenium not installed. Screenshots will not be captured.")
+            self.capture_screenshots = False
+        except Exception as e:
+            logger.warning(f"Error initializing browser for screenshots: {str(e)}")
+            self.capture_screenshots = False
+        return False
+
+    def _capture_screenshot(self, url, target_dir, prefix, file_tag):
         """
         Capture a screenshot of a URL using Selenium.
 
@@ -402,6 +516,7 @@ class EvidenceCollector:
             url: URL to capture
             target_dir: Directory to save the screenshot
             prefix: Prefix for the screenshot filename
+            file_tag: Unique suffix for the screenshot filename
 
         Returns:
             Path to the saved screenshot, or None if failed
@@ -411,13 +526,21 @@ class EvidenceCollector:
 
         try:
             # Generate filename
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"{prefix}_{timestamp}.png"
+            filename = f"{prefix}_{file_tag}.png"
             filepath = target_dir / filename
 
             # Navigate to URL and capture screenshot
-            self.browser.get(url)
-            self.browser.save_screenshot(str(filepath))
+            with self._browser_lock:
+                if not self._ensure_browser():
+                    return None
+
+                # Reuse the loaded page when several vulnerabilities share a URL
+                if self.browser.current_url != url:
+                    self.browser.get(url)
+                screenshot = self.browser.get_screenshot_as_png()
+
+            # Write the PNG outside the lock so the next capture can start
+            filepath.write_bytes(screenshot)
 
             logger.info(f"Screenshot saved: {filepath}")
             return filepath
@@ -428,8 +551,16 @@ class EvidenceCollector:
 
     def close(self):
         """Close any open resources."""
-        if self.capture_screenshots and hasattr(self, 'browser'):
+        # Let pending manifest writes finish
+        self._writer.shutdown(wait=True)
+
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+        if self.browser is not None:
             try:
                 self.browser.quit()
             except Exception:
-                pass
\ No newline at end of file
+                pass
+            self.browser = None
\ No newline at end of file
@@ -3,36 +3,226 @@
 Network scanner module for port scanning and service detection.
 """
 
+import asyncio
+import itertools
 import logging
+import re
 import socket
+import struct
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from urllib.parse import urlparse
 import requests
+from requests.adapters import HTTPAdapter
 import subprocess
 import platform
 
+# Single-pass multi-pattern matching for technology detection when pyahocorasick is installed
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# In-process ICMP echo for ping sweeps when icmplib is installed
+try:
+    import icmplib
+    ICMPLIB_AVAILABLE = True
+except ImportError:
+    ICMPLIB_AVAILABLE = False
+
+# Non-blocking DNS resolution for subdomain enumeration when aiodns is installed
+try:
+    import aiodns
+    AIODNS_AVAILABLE = True
+except ImportError:
+    AIODNS_AVAILABLE = False
+
 logger = logging.getLogger("vanguard.network_scanner")
 
+# Port scans at least this wide record open ports in a bitmap instead of a list
+PORT_BITMAP_MIN_PORTS = 1024
+
+# System ping command for a single echo with a one second wait
+if platform.system().lower() == "windows":
+    PING_COMMAND = ["ping", "-n", "1", "-w", "1000"]
+else:
+    PING_COMMAND = ["ping", "-c", "1", "-W", "1"]
+
+# SO_LINGER with a zero timeout: close() resets the connection instead of
+# leaving it in TIME_WAIT, which would exhaust ephemeral ports on wide scans
+ABORTIVE_LINGER = struct.pack('ii', 1, 0)
+
+# Ping processes run at once, and how long each batch may take in seconds
+PING_BATCH_SIZE = 64
+PING_TIMEOUT = 3
+
+# Version patterns for service banners, compiled once at import; a full
+# x.y.z version anywhere in the banner wins over an earlier x.y one
+VERSION_PATTERNS = (
+    re.compile(r'(\d+\.\d+\.\d+)'),
+    re.compile(r'(\d+\.\d+)'),
+)
+
+# Common technology indicators, matched against lowercased headers and body
+TECH_INDICATORS = {
+    'apache': 'Apache',
+    'nginx': 'Nginx',
+    'iis': 'IIS',
+    'php': 'PHP',
+    'asp.net': 'ASP.NET',
+    'python': 'Python',
+    'node.js': 'Node.js',
+    'express': 'Express.js'
+}
+
+# Byte forms of the indicators, matched against the undecoded body
+TECH_INDICATOR_BYTES = {indicator.encode(): tech for indicator, tech in TECH_INDICATORS.items()}
+
+# Only the start of a page is downloaded and scanned for technology indicators
+TECH_SCAN_MAX_BYTES = 64 * 1024
+
+if AHOCORASICK_AVAILABLE:
+    # Automaton finding every indicator in one pass over the text
+    TECH_AUTOMATON = ahocorasick.Automaton()
+    for _indicator, _tech in TECH_INDICATORS.items():
+        TECH_AUTOMATON.add_word(_indicator, _tech)
+    TECH_AUTOMATON.make_automaton()
+
+@lru_cache(maxsize=4096)
+def _resolve_cached(hostname):
+    """Resolve a hostname to an IPv4 address, caching successful lookups across scans."""
+    # lru_cache does not store raised exceptions, so failed lookups are retried
+    return socket.gethostbyname(hostname)
+
+def _resolve(hostname):
+    """Resolve a hostname to an IPv4 address; None if it doesn't resolve."""
+    try:
+        return _resolve_cached(hostname)
+    except socket.gaierror:
+        return None
+
+class AIMDController:
+    """Adaptive concurrency limit using additive increase, multiplicative decrease."""
+    
+    def __init__(self, maximum, target_latency, increase=0.5, decrease=0.5, minimum=1, window=10,
+                 timeout_threshold=0.3):
+        """
+        Initialize the controller at its maximum concurrency.
+        
+        Args:
+            maximum: Upper bound on concurrent operations
+            target_latency: Mean latency in seconds at or below which the limit grows
+            increase: Amount added to the limit after a healthy window
+            decrease: Factor applied to the limit after a congested window
+            minimum: Lower bound on concurrent operations
+            window: Number of samples (latencies and timeouts) per adjustment
+            timeout_threshold: Rise of a window's timeout share above the
+                running share that counts as a timeout storm
+        """
+        self.maximum = maximum
+        self.minimum = minimum
+        self.target_latency = target_latency
+        self.increase = increase
+        self.decrease = decrease
+        self.window = window
+        self.timeout_threshold = timeout_threshold
+        self.limit = float(maximum)
+        self._in_flight = 0
+        self._samples = []
+        self._total_samples = 0
+        self._total_timeouts = 0
+        self._condition = asyncio.Condition()
+        
+    async def acquire(self):
+        """Wait until a slot under the current limit is free and take it."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < int(self.limit))
+            self._in_flight += 1
+            
+    async def release(self, latency=None):
+        """
+        Free a slot and adjust the limit.
+        
+        Args:
+            latency: Seconds the operation took, or None if it timed out
+        """
+        async with self._condition:
+            self._in_flight -= 1
+            
+            self._samples.append(latency)
+            if len(self._samples) >= self.window:
+                if self._is_congested(self._samples):
+                    self.limit = max(self.minimum, self.limit * self.decrease)
+                else:
+                    self.limit = min(self.maximum, self.limit + self.increase)
+                self._samples.clear()
+                        
+            self._condition.notify_all()
+            
+    def _is_congested(self, samples):
+        """
+        Decide whether a full window of samples shows congestion.
+        
+        Filtered ports time out on every probe, so timeouts only count once
+        their share of the window rises above the share seen so far.
+        
+        Args:
+            samples: Latencies in seconds, with None for timeouts
+            
+        Returns:
+            True if the window's latency or timeout share is over threshold
+        """
+        latencies = [latency for latency in samples if latency is not None]
+        timeouts = len(samples) - len(latencies)
+        
+        timeout_share = timeouts / len(samples)
+        if self._total_samples:
+            baseline_share = self._total_timeouts / self._total_samples
+        else:
+            baseline_share = timeout_share
+        self._total_samples += len(samples)
+        self._total_timeouts += timeouts
+        
+        if timeout_share - baseline_share > self.timeout_threshold:
+            return True
+        return bool(latencies) and sum(latencies) / len(latencies) > self.target_latency
+
 class NetworkScanner:
     """Advanced network scanner for service discovery and enumeration."""
     
-    def __init__(self, timeout=3, max_workers=50, rate_limit=10):
+    def __init__(self, timeout=3, max_workers=50, rate_limit=10, target_latency=1.0,
+                 aimd_increase=0.5, aimd_decrease=0.5):
         """
         Initialize the network scanner.
         
         Args:
             timeout: Socket timeout in seconds
-            max_workers: Maximum concurrent threads
+            max_workers: Maximum concurrent connections
             rate_limit: Requests per second limit
+            target_latency: Connect latency in seconds above which port scans back off
+            aimd_increase: Connections added to the port scan limit while latency is healthy
+            aimd_decrease: Factor applied to the port scan limit on slow connects or timeout storms
         """
         self.timeout = timeout
         self.max_workers = max_workers
         self.rate_limit = rate_limit
-        self.last_request_time = 0
+        self.target_latency = target_latency
+        self.aimd_increase = aimd_increase
+        self.aimd_decrease = aimd_decrease
+        # Token bucket holding up to one second's worth of requests
+        self._tokens = float(rate_limit)
+        self._last_refill = time.monotonic()
         self.lock = threading.Lock()
         
+        # Shared session so web server probes reuse keep-alive connections
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=0)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
         # Common ports for scanning
         self.common_ports = [
             21, 22, 23, 25, 53, 80, 110, 111, 135, 139, 143, 443, 993, 995,
@@ -90,9 +280,8 @@ class NetworkScanner:
             default_port = None
             
         # Resolve hostname
-        try:
-            ip_address = socket.gethostbyname(hostname)
-        except socket.gaierror:
+        ip_address = _resolve(hostname)
+        if ip_address is None:
             logger.error(f"Could not resolve hostname: {hostname}")
             return None
             
@@ -108,18 +297,16 @@ class NetworkScanner:
         }
         
         # Port scan
-        ports_to_scan = ports or self.common_ports
+        # Copy so concurrent scans never mutate the shared default list
+        ports_to_scan = list(ports or self.common_ports)
         if default_port and default_port not in ports_to_scan:
             ports_to_scan.append(default_port)
             
-        open_ports = self._port_scan(ip_address, ports_to_scan)
+        # Banners are grabbed over the same connections that found the open ports
+        services = self._port_scan(ip_address, ports_to_scan)
+        open_ports = list(services)
         scan_results['open_ports'] = open_ports
-        
-        # Service detection
-        for port in open_ports:
-            service_info = self._detect_service(ip_address, port)
-            if service_info:
-                scan_results['services'][port] = service_info
+        scan_results['services'] = services
                 
         # Web server detection
         web_ports = [p for p in open_ports if p in [80, 443, 8080, 8443]]
@@ -131,51 +318,99 @@ class NetworkScanner:
         logger.info(f"Scan completed for {target}: {len(open_ports)} open ports found")
         return scan_results
 
-    def _rate_limit_wait(self):
-        """Implement rate limiting."""
+    def _rate_limit_delay(self):
+        """
+        Reserve the next request slot under the rate limit.
+        
+        Returns:
+            Seconds to wait before sending the request
+        """
         with self.lock:
-            current_time = time.time()
-            time_since_last = current_time - self.last_request_time
-            min_interval = 1.0 / self.rate_limit
+            current_time = time.monotonic()
             
-            if time_since_last < min_interval:
-                sleep_time = min_interval - time_since_last
-                time.sleep(sleep_time)
-                
-            self.last_request_time = time.time()
+            # Refill for the time elapsed since the last request
+            elapsed = current_time - self._last_refill
+            self._tokens = min(self.rate_limit, self._tokens + elapsed * self.rate_limit)
+            self._last_refill = current_time
+            
+            # Take a token now; a deficit is the caller's wait, slept outside the lock
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0
+            return -self._tokens / self.rate_limit
 
     def _port_scan(self, ip_address, ports):
         """
-        Perform multi-threaded port scan.
+        Perform asynchronous port scan, grabbing each open port's banner.
         
         Args:
             ip_address: Target IP address
             ports: List of ports to scan
             
         Returns:
-            List of open ports
+            Dictionary mapping each open port, in order, to its service information
+        """
+        return asyncio.run(self._port_scan_async(ip_address, ports))
+
+    async def _port_scan_async(self, ip_address, ports):
         """
-        open_ports = []
+        Scan ports concurrently on a single event loop.
         
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit port scan tasks
-            future_to_port = {
-                executor.submit(self._scan_port, ip_address, port): port 
-                for port in ports
-            }
+        Args:
+            ip_address: Target IP address
+            ports: List of ports to scan
             
-            # Collect results
-            for future in as_completed(future_to_port):
-                port = future_to_port[future]
-                try:
-                    if future.result():
-                        open_ports.append(port)
-                except Exception as e:
-                    logger.debug(f"Error scanning port {port}: {str(e)}")
+        Returns:
+            Dictionary mapping each open port, in order, to its service information
+        """
+        # Cap the number of connections in flight, adapting to the target
+        controller = AIMDController(
+            self.max_workers, self.target_latency,
+            increase=self.aimd_increase, decrease=self.aimd_decrease
+        )
+        
+        async def scan(port):
+            delay = self._rate_limit_delay()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                
+            await controller.acquire()
+            start = time.monotonic()
+            connection = None
+            try:
+                connection = await self._scan_port_async(ip_address, port)
+            finally:
+                # Only the connect is timed; banners can legitimately take a while
+                latency = time.monotonic() - start if connection is not None else None
+                await controller.release(latency)
+                
+            if not connection:
+                return None
+                
+            # Reuse the scan's connection for the banner grab
+            return await self._detect_service(ip_address, port, *connection)
+            
+        results = await asyncio.gather(*(scan(port) for port in ports), return_exceptions=True)
+        
+        # Wide scans mark open ports in a bitmap, which reads back already sorted
+        use_bitmap = len(ports) >= PORT_BITMAP_MIN_PORTS
+        bitmap = bytearray(65536) if use_bitmap else None
+        services = {}
+        for port, service_info in zip(ports, results):
+            if isinstance(service_info, Exception):
+                logger.debug("Error scanning port %s: %s", port, service_info)
+            elif service_info:
+                services[port] = service_info
+                if use_bitmap:
+                    bitmap[port] = 1
                     
-        return sorted(open_ports)
+        if use_bitmap:
+            open_ports = itertools.compress(range(len(bitmap)), bitmap)
+        else:
+            open_ports = sorted(services)
+        return {port: services[port] for port in open_ports}
 
-    def _scan_port(self, ip_address, port):
+    async def _scan_port_async(self, ip_address, port):
         """
         Scan a single port.
         
@@ -184,26 +419,33 @@ class NetworkScanner:
             port: Port number to scan
             
         Returns:
-            Boolean indicating if port is open
+            (reader, writer) connection if the port is open, False if it is
+            closed, or None if the connection timed out
         """
-        self._rate_limit_wait()
-        
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(self.timeout)
-            result = sock.connect_ex((ip_address, port))
-            sock.close()
-            return result == 0
-        except Exception:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(ip_address, port), timeout=self.timeout
+            )
+        except asyncio.TimeoutError:
+            return None
+        except OSError:
             return False
+            
+        # asyncio already disables Nagle on TCP streams; skip the graceful close too
+        sock = writer.get_extra_info('socket')
+        if sock is not None:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, ABORTIVE_LINGER)
+        return reader, writer
 
-    def _detect_service(self, ip_address, port):
+    async def _detect_service(self, ip_address, port, reader, writer):
         """
-        Detect service running on a port.
+        Detect service running on a port over an open connection.
         
         Args:
             ip_address: Target IP address
             port: Port number
+            reader: Stream reader of the connection to the port
+            writer: Stream writer of the connection, closed when done
             
         Returns:
             Dictionary with service information
@@ -217,30 +459,28 @@ class NetworkScanner:
         
         # Try to grab banner
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(self.timeout)
-            sock.connect((ip_address, port))
-            
             # Send appropriate probe
             if port == 80:
-                sock.send(b"GET / HTTP/1.1\r\nHost: " + ip_address.encode() + b"\r\n\r\n")
+                writer.write(b"GET / HTTP/1.1\r\nHost: " + ip_address.encode() + b"\r\n\r\n")
             elif port == 21:
                 pass  # FTP sends banner automatically
             elif port == 22:
                 pass  # SSH sends banner automatically
             elif port == 25:
-                sock.send(b"EHLO test\r\n")
+                writer.write(b"EHLO test\r\n")
+            await writer.drain()
             
             # Receive banner
-            banner = sock.recv(1024).decode('utf-8', errors='ignore').strip()
+            data = await asyncio.wait_for(reader.read(1024), timeout=self.timeout)
+            banner = data.decode('utf-8', errors='ignore').strip()
             if banner:
                 service_info['banner'] = banner
                 service_info['version'] = self._extract_version(banner)
                 
-            sock.close()
-            
         except Exception as e:
-            logger.debug(f"Banner grab failed for {ip_address}:{port}: {str(e)}")
+            logger.debug("Banner grab failed for %s:%s: %s", ip_address, port, e)
+        finally:
+            writer.close()
             
         return service_info
 
@@ -259,71 +499,61 @@ class NetworkScanner:
         url = f"{protocol}://{hostname}:{port}"
         
         try:
-            response = requests.get(url, timeout=self.timeout, verify=False,
-                                  allow_redirects=False)
-            
-            web_info = {
-                'url': url,
-                'status_code': response.status_code,
-                'server': response.headers.get('Server', 'Unknown'),
-                'powered_by': response.headers.get('X-Powered-By', ''),
-                'technologies': self._detect_technologies(response),
-                'security_headers': self._check_security_headers(response.headers)
-            }
-            
+            # Stream the body so large pages are never downloaded in full
+            with self.session.get(url, timeout=self.timeout, verify=False,
+                                  allow_redirects=False, stream=True) as response:
+                content = response.raw.read(TECH_SCAN_MAX_BYTES, decode_content=True)
+                
+                web_info = {
+                    'url': url,
+                    'status_code': response.status_code,
+                    'server': response.headers.get('Server', 'Unknown'),
+                    'powered_by': response.headers.get('X-Powered-By', ''),
+                    'technologies': self._detect_technologies(response.headers, content),
+                    'security_headers': self._check_security_headers(response.headers)
+                }
+                
             return web_info
             
         except Exception as e:
-            logger.debug(f"Web server detection failed for {url}: {str(e)}")
+            logger.debug("Web server detection failed for %s: %s", url, e)
             return None
 
     def _extract_version(self, banner):
         """Extract version information from service banner."""
-        import re
-        
-        # Common version patterns
-        patterns = [
-            r'(\d+\.\d+\.\d+)',
-            r'(\d+\.\d+)',
-            r'version\s+(\d+\.\d+\.\d+)',
-            r'v(\d+\.\d+)'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, banner, re.IGNORECASE)
+        for pattern in VERSION_PATTERNS:
+            match = pattern.search(banner)
             if match:
                 return match.group(1)
                 
         return None
 
-    def _detect_technologies(self, response):
-        """Detect web technologies from response."""
-        technologies = []
-        
+    def _detect_technologies(self, headers, content):
+        """Detect web technologies from response headers and the raw start of the body."""
         # Check headers
-        server = response.headers.get('Server', '').lower()
-        powered_by = response.headers.get('X-Powered-By', '').lower()
-        
-        # Common technology indicators
-        tech_indicators = {
-            'apache': 'Apache',
-            'nginx': 'Nginx',
-            'iis': 'IIS',
-            'php': 'PHP',
-            'asp.net': 'ASP.NET',
-            'python': 'Python',
-            'node.js': 'Node.js',
-            'express': 'Express.js'
-        }
+        server = headers.get('Server', '').lower()
+        powered_by = headers.get('X-Powered-By', '').lower()
         
-        content = response.text.lower()
+        # Indicators are ASCII, so the body is matched as bytes without decoding it
+        content = content.lower()
         
-        for indicator, tech in tech_indicators.items():
-            if indicator in server or indicator in powered_by or indicator in content:
-                if tech not in technologies:
-                    technologies.append(tech)
-                    
-        return technologies
+        if AHOCORASICK_AVAILABLE:
+            # The automaton matches str; latin-1 maps each byte to one character
+            found = set()
+            for text in (server, powered_by, content.decode('latin-1')):
+                found.update(tech for _, tech in TECH_AUTOMATON.iter(text))
+        else:
+            found = {
+                tech for indicator, tech in TECH_INDICATORS.items()
+                if indicator in server or indicator in powered_by
+            }
+            found.update(
+                tech for indicator, tech in TECH_INDICATOR_BYTES.items()
+                if indicator in content
+            )
+            
+        # Report in indicator order, as before
+        return [tech for tech in dict.fromkeys(TECH_INDICATORS.values()) if tech in found]
 
     def _check_security_headers(self, headers):
         """Check for security headers."""
@@ -355,6 +585,9 @@ class NetworkScanner:
                 'crm', 'cms', 'wiki', 'blog', 'dev', 'test', 'staging', 'admin', 'api'
             ]
             
+        if AIODNS_AVAILABLE:
+            return asyncio.run(self._discover_subdomains_async(domain, wordlist))
+            
         discovered = []
         
         with ThreadPoolExecutor(max_workers=20) as executor:
@@ -371,18 +604,44 @@ class NetworkScanner:
                         discovered.append(full_domain)
                         logger.info(f"Discovered subdomain: {full_domain}")
                 except Exception as e:
-                    logger.debug(f"Error checking subdomain {subdomain}: {str(e)}")
+                    logger.debug("Error checking subdomain %s: %s", subdomain, e)
                     
         return discovered
 
+    async def _discover_subdomains_async(self, domain, wordlist):
+        """
+        Resolve candidate subdomains concurrently with c-ares.
+        
+        Args:
+            domain: Target domain
+            wordlist: List of subdomain names to try
+            
+        Returns:
+            List of discovered subdomains
+        """
+        resolver = aiodns.DNSResolver(timeout=self.timeout)
+        semaphore = asyncio.Semaphore(200)
+        discovered = []
+        
+        async def check(subdomain):
+            full_domain = f"{subdomain}.{domain}"
+            async with semaphore:
+                try:
+                    await resolver.gethostbyname(full_domain, socket.AF_INET)
+                except aiodns.error.DNSError:
+                    return
+                except Exception as e:
+                    logger.debug("Error checking subdomain %s: %s", subdomain, e)
+                    return
+            discovered.append(full_domain)
+            logger.info(f"Discovered subdomain: {full_domain}")
+            
+        await asyncio.gather(*(check(subdomain) for subdomain in wordlist))
+        return discovered
+
     def _check_subdomain(self, subdomain, domain):
         """Check if a subdomain exists."""
-        full_domain = f"{subdomain}.{domain}"
-        try:
-            socket.gethostbyname(full_domain)
-            return True
-        except socket.gaierror:
-            return False
+        return _resolve(f"{subdomain}.{domain}") is not None
 
     def ping_sweep(self, network):
         """
@@ -400,42 +659,67 @@ class NetworkScanner:
             logger.error("ipaddress module required for ping sweep")
             return []
             
-        active_hosts = []
-        
         try:
             net = ipaddress.IPv4Network(network, strict=False)
-            hosts = list(net.hosts())
+            hosts = [str(host) for host in net.hosts()]
+            
+            if ICMPLIB_AVAILABLE:
+                try:
+                    return self._ping_sweep_icmp(hosts)
+                except icmplib.SocketPermissionError:
+                    logger.debug("Unprivileged ICMP sockets unavailable, falling back to ping command")
+                    
+            return self._ping_sweep_subprocess(hosts)
             
-            with ThreadPoolExecutor(max_workers=50) as executor:
-                future_to_host = {
-                    executor.submit(self._ping_host, str(host)): host
-                    for host in hosts
-                }
-                
-                for future in as_completed(future_to_host):
-                    host = future_to_host[future]
-                    try:
-                        if future.result():
-                            active_hosts.append(str(host))
-                    except Exception as e:
-                        logger.debug(f"Error pinging {host}: {str(e)}")
-                        
         except Exception as e:
             logger.error(f"Error in ping sweep: {str(e)}")
+            return []
+
+    def _ping_sweep_icmp(self, hosts):
+        """
+        Ping hosts concurrently with ICMP echo requests sent from this process.
+        
+        Args:
+            hosts: List of host addresses
             
-        return active_hosts
+        Returns:
+            List of active hosts
+        """
+        results = asyncio.run(icmplib.async_multiping(
+            hosts, count=1, timeout=1, concurrent_tasks=256, privileged=False
+        ))
+        return [host.address for host in results if host.is_alive]
 
-    def _ping_host(self, host):
-        """Ping a single host."""
-        try:
-            # Use system ping command
-            if platform.system().lower() == "windows":
-                cmd = ["ping", "-n", "1", "-w", "1000", host]
-            else:
-                cmd = ["ping", "-c", "1", "-W", "1", host]
-                
-            result = subprocess.run(cmd, capture_output=True, timeout=3)
-            return result.returncode == 0
+    def _ping_sweep_subprocess(self, hosts):
+        """
+        Ping hosts with the system ping command, launching a batch at a time.
+        
+        Args:
+            hosts: List of host addresses
             
-        except Exception:
-            return False
+        Returns:
+            List of active hosts
+        """
+        active_hosts = []
+        
+        for start in range(0, len(hosts), PING_BATCH_SIZE):
+            processes = []
+            for host in hosts[start:start + PING_BATCH_SIZE]:
+                try:
+                    process = subprocess.Popen(PING_COMMAND + [host], stdout=subprocess.DEVNULL,
+                                               stderr=subprocess.DEVNULL)
+                    processes.append((host, process))
+                except OSError as e:
+                    logger.debug("Error pinging %s: %s", host, e)
+                    
+            # The whole batch shares one deadline rather than one per host
+            deadline = time.monotonic() + PING_TIMEOUT
+            for host, process in processes:
+                try:
+                    if process.wait(timeout=max(0, deadline - time.monotonic())) == 0:
+                        active_hosts.append(host)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+                    process.wait()
+                    
+        return active_hosts
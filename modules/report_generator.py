@@ -6,18 +6,123 @@ Report generator module for creating vulnerability assessment reports.
 import logging
 import json
 import os
+import re
 import datetime
+import gzip
 from pathlib import Path
 import shutil
-from urllib.parse import urlparse
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+
+# Faster JSON encoding when orjson is installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    # Findings carry int-keyed service maps
+    ORJSON_REPORT_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger("deep_analytics.report")
 
+# Host part of a URL, for report titles; same result as urlparse(url).netloc
+NETLOC_PATTERN = re.compile(r'(?:[A-Za-z][A-Za-z0-9+.-]*:)?//([^/?#]*)')
+
+# Guards ReportGenerator._templates_checked across threads
+_templates_lock = threading.Lock()
+
+# Jinja2 environments shared by all generators, keyed by template directory
+_jinja_envs = {}
+_jinja_envs_lock = threading.Lock()
+
+def _to_json(obj):
+    """Serialize an object as indented JSON for the to_json template filter."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=ORJSON_REPORT_OPTIONS).decode('utf-8')
+    return json.dumps(obj, indent=2)
+
+class PdfConverter:
+    """Long-lived wkhtmltopdf process converting HTML files to PDF, one job per stdin line."""
+    
+    def __init__(self, executable):
+        """
+        Start the wkhtmltopdf process.
+        
+        Args:
+            executable: Path to the wkhtmltopdf binary
+        """
+        self.process = subprocess.Popen(
+            [executable, '--quiet', '--read-args-from-stdin'],
+            stdin=subprocess.PIPE,
+            text=True,
+            encoding='utf-8'
+        )
+        self.lock = threading.Lock()
+        # (html_path, pdf_path) of conversions whose HTML is removed on close
+        self.intermediates = []
+    
+    def submit(self, html_path, pdf_path, remove_html=False):
+        """
+        Queue a conversion; the PDF is complete once close() returns.
+        
+        Args:
+            html_path: Path of the HTML file to convert
+            pdf_path: Path of the PDF file to write
+            remove_html: Delete the HTML file once the PDF has been written
+        """
+        # Remove any PDF from an earlier run, so its presence after close()
+        # means this conversion succeeded
+        Path(pdf_path).unlink(missing_ok=True)
+        
+        line = f"{self._quote(html_path)} {self._quote(pdf_path)}\n"
+        with self.lock:
+            self.process.stdin.write(line)
+            self.process.stdin.flush()
+            if remove_html:
+                self.intermediates.append((Path(html_path), Path(pdf_path)))
+    
+    def close(self):
+        """Finish all queued conversions, stop the process and remove intermediate HTML files."""
+        with self.lock:
+            if not self.process.stdin.closed:
+                try:
+                    self.process.stdin.close()
+                except BrokenPipeError:
+                    # wkhtmltopdf already exited; nothing more will be converted
+                    pass
+        self.process.wait()
+        
+        # Keep the HTML of any conversion that failed, so the report isn't lost
+        for html_path, pdf_path in self.intermediates:
+            if pdf_path.exists():
+                html_path.unlink(missing_ok=True)
+        self.intermediates.clear()
+    
+    @staticmethod
+    def _quote(path):
+        """Quote a path as a single wkhtmltopdf stdin argument."""
+        escaped = str(path).replace('\\', '\\\\').replace('"', '\\"')
+        return f'"{escaped}"'
+
 class ReportGenerator:
     """Generates vulnerability assessment reports in various formats."""
     
-    def __init__(self, output_format="html", template_dir="./templates", output_dir="./output"):
+    # Reports with embedded HTTP dumps get large; write them in big chunks
+    WRITE_BUFFER_SIZE = 1 << 20
+    
+    # Characters not allowed in filenames, replaced in a single pass
+    FILENAME_TRANSLATION = str.maketrans(dict.fromkeys('<>:"/\\|?*', '_'))
+    
+    # Longest filename stem generated from a report title
+    MAX_FILENAME_LENGTH = 50
+    
+    # Template directories already checked in this process
+    _templates_checked = set()
+    
+    def __init__(self, output_format="html", template_dir="./templates", output_dir="./output", compress=False,
+                 keep_html=False):
         """
         Initialize the report generator.
         
@@ -25,8 +130,12 @@ class ReportGenerator:
             output_format: Format of the generated report (html, markdown, json, pdf)
             template_dir: Directory containing report templates
             output_dir: Directory to save the generated reports
+            compress: Write HTML, Markdown and JSON reports gzip-compressed (.gz)
+            keep_html: Keep the HTML files PDF reports are converted from
         """
         self.output_format = output_format
+        self.compress = compress
+        self.keep_html = keep_html
         self.template_dir = Path(template_dir)
         self.output_dir = Path(output_dir)
         
@@ -38,41 +147,89 @@ class ReportGenerator:
         
         # Ensure templates directory exists
         self._ensure_templates()
+        
+        # wkhtmltopdf process shared by all PDF reports, started on first use
+        self._pdf_converter = None
+        self._pdf_converter_lock = threading.Lock()
+        
+        # Compile the templates once; reports reuse them without re-checking the files
+        self.html_template = self.jinja_env.get_template("report_template.html")
+        self.exec_summary_template = self.jinja_env.get_template("executive_summary_template.html")
     
     def _setup_jinja_environment(self):
-        """Set up Jinja2 environment for templates."""
+        """Set up Jinja2 environment for templates, shared with other generators using the same directory."""
+        key = str(self.template_dir.absolute())
+        with _jinja_envs_lock:
+            self.jinja_env = _jinja_envs.get(key)
+            if self.jinja_env is None:
+                self.jinja_env = _jinja_envs[key] = self._create_jinja_environment()
+    
+    def _create_jinja_environment(self):
+        """
+        Create the Jinja2 environment for the template directory.
+        
+        Returns:
+            Configured Jinja2 Environment
+        """
         # Create template directory if it doesn't exist
         self.template_dir.mkdir(exist_ok=True, parents=True)
         
+        # Compiled templates are cached on disk, so later runs
+        # load bytecode instead of parsing the template sources again
+        cache_dir = self.template_dir / ".jinja_cache"
+        cache_dir.mkdir(exist_ok=True)
+        
         # Set up Jinja2 environment
-        self.jinja_env = Environment(
+        env = Environment(
             loader=FileSystemLoader(self.template_dir),
+            bytecode_cache=FileSystemBytecodeCache(str(cache_dir)),
             autoescape=select_autoescape(['html', 'xml']),
             trim_blocks=True,
-            lstrip_blocks=True
+            lstrip_blocks=True,
+            cache_size=-1,
+            auto_reload=False
         )
         
         # Add custom filters
-        self.jinja_env.filters['to_json'] = lambda obj: json.dumps(obj, indent=2)
-        self.jinja_env.filters['datetime_format'] = lambda dt: dt.strftime('%Y-%m-%d %H:%M:%S')
+        env.filters['to_json'] = _to_json
+        env.filters['datetime_format'] = lambda dt: dt.strftime('%Y-%m-%d %H:%M:%S')
+        
+        return env
     
     def _ensure_templates(self):
         """Ensure that template files exist, create if not."""
+        # Only check each template directory once per process
+        key = str(self.template_dir.absolute())
+        with _templates_lock:
+            if key in ReportGenerator._templates_checked:
+                return
+            self._create_missing_templates()
+            ReportGenerator._templates_checked.add(key)
+    
+    def _create_missing_templates(self):
+        """Create any default template files missing from the template directory."""
         # Check for HTML template
         html_template_path = self.template_dir / "report_template.html"
         if not html_template_path.exists():
             self._create_default_html_template(html_template_path)
         
-        # Check for Markdown template
-        md_template_path = self.template_dir / "report_template.md"
-        if not md_template_path.exists():
-            self._create_default_md_template(md_template_path)
-        
         # Check for executive summary template
         exec_template_path = self.template_dir / "executive_summary_template.html"
         if not exec_template_path.exists():
             self._create_default_exec_summary_template(exec_template_path)
     
+    def _write_template(self, template_path, template_content):
+        """
+        Write a template file atomically, so a concurrent reader never sees it half-written.
+        
+        Args:
+            template_path: Path of the template file
+            template_content: Template source
+        """
+        tmp_path = template_path.with_name(f"{template_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(template_content, encoding='utf-8')
+        os.replace(tmp_path, template_path)
+    
     def _create_default_html_template(self, template_path):
         """Create a default HTML report template."""
         template_content = """<!DOCTYPE html>
@@ -196,7 +353,7 @@ class ReportGenerator:
     
     <h2>Findings</h2>
     {% for finding in findings %}
-    <div class="finding severity-{{ finding.vulnerabilities[0].severity.rating|lower }}">
+    <div class="finding severity-{{ finding.severity_class }}">
         <h3>Target: {{ finding.url }}</h3>
         <div class="target-info">
             <p><strong>Status Code:</strong> {{ finding.status_code }}</p>
@@ -274,100 +431,10 @@ class ReportGenerator:
 """
         
         # Write template to file
-        with open(template_path, 'w') as f:
-            f.write(template_content)
+        self._write_template(template_path, template_content)
             
         logger.info(f"Created default HTML template: {template_path}")
     
-    def _create_default_md_template(self, template_path):
-        """Create a default Markdown report template."""
-        template_content = """# {{ title }}
-
-*Generated on: {{ generation_date }}*
-
-## Report Information
-**Author:** {{ author }}
-**Generation Date:** {{ generation_date }}
-**Total Findings:** {{ findings|length }}
-
-## Executive Summary
-This report details {{ findings|length }} security vulnerabilities discovered during security testing.
-
-## Findings
-
-{% for finding in findings %}
-### Target: {{ finding.url }}
-**Status Code:** {{ finding.status_code }}
-**Server:** {{ finding.server }}
-
-{% for vuln in finding.vulnerabilities %}
-#### {{ vuln.type }} - {{ vuln.severity.rating }} (CVSS: {{ vuln.severity.cvss_score }})
-{{ vuln.description }}
-
-##### Technical Details
-```json
-{{ vuln.technical_details|to_json }}
-```
-
-##### Proof of Concept
-```
-{{ vuln.proof_of_concept }}
-```
-
-{% if vuln.potential_cves %}
-##### Related CVEs
-{% for cve in vuln.potential_cves %}
-**{{ cve.cve_id }}** - {{ cve.description }}
-**Severity:** {{ cve.severity }} (CVSS: {{ cve.cvss_score }})
-**References:** {% for ref in cve.references %}[{{ ref }}]({{ ref }}){% if not loop.last %}, {% endif %}{% endfor %}
-
-{% endfor %}
-{% endif %}
-
-##### Remediation Recommendations
-{% for step in vuln.remediation %}
-- {{ step }}
-{% endfor %}
-
-{% endfor %}
-
-{% if finding.evidence %}
-##### Evidence
-{% for evidence_item in finding.evidence %}
-**Timestamp:** {{ evidence_item.timestamp }}
-{% if evidence_item.screenshot_path %}
-**Screenshot:** [View Screenshot]({{ evidence_item.screenshot_path }})
-{% endif %}
-
-**HTTP Request:**
-```
-{{ evidence_item.http_request }}
-```
-
-**HTTP Response:**
-```
-{{ evidence_item.http_response }}
-```
-
-**Notes:** {{ evidence_item.notes }}
-
-{% endfor %}
-{% endif %}
-
-{% endfor %}
-
----
-
-Report generated using Deep Analytics - Automated Vulnerability Analysis Tool
-© {{ current_year }} Security Research Team
-"""
-        
-        # Write template to file
-        with open(template_path, 'w') as f:
-            f.write(template_content)
-            
-        logger.info(f"Created default Markdown template: {template_path}")
-
     def _create_default_exec_summary_template(self, template_path):
         """Create a default executive summary template."""
         template_content = """<!DOCTYPE html>
@@ -480,53 +547,53 @@ Report generated using Deep Analytics - Automated Vulnerability Analysis Tool
         <h3>Key Statistics:</h3>
         <ul>
             <li><strong>Total Vulnerabilities:</strong> {{ total_vulnerabilities }}</li>
-            <li><strong>Critical Severity:</strong> {{ severity_counts.Critical|default(0) }}</li>
-            <li><strong>High Severity:</strong> {{ severity_counts.High|default(0) }}</li>
-            <li><strong>Medium Severity:</strong> {{ severity_counts.Medium|default(0) }}</li>
-            <li><strong>Low Severity:</strong> {{ severity_counts.Low|default(0) }}</li>
+            <li><strong>Critical Severity:</strong> {{ severity_counts.Critical }}</li>
+            <li><strong>High Severity:</strong> {{ severity_counts.High }}</li>
+            <li><strong>Medium Severity:</strong> {{ severity_counts.Medium }}</li>
+            <li><strong>Low Severity:</strong> {{ severity_counts.Low }}</li>
         </ul>
         
         <div class="severity-chart">
-            {% if severity_counts.Critical|default(0) > 0 %}
-            <div class="severity-critical" style="width: {{ (severity_counts.Critical / total_vulnerabilities * 100)|round }}%;"></div>
+            {% if severity_counts.Critical > 0 %}
+            <div class="severity-critical" style="width: {{ severity_percentages.Critical }}%;"></div>
             {% endif %}
             
-            {% if severity_counts.High|default(0) > 0 %}
-            <div class="severity-high" style="width: {{ (severity_counts.High / total_vulnerabilities * 100)|round }}%;"></div>
+            {% if severity_counts.High > 0 %}
+            <div class="severity-high" style="width: {{ severity_percentages.High }}%;"></div>
             {% endif %}
             
-            {% if severity_counts.Medium|default(0) > 0 %}
-            <div class="severity-medium" style="width: {{ (severity_counts.Medium / total_vulnerabilities * 100)|round }}%;"></div>
+            {% if severity_counts.Medium > 0 %}
+            <div class="severity-medium" style="width: {{ severity_percentages.Medium }}%;"></div>
             {% endif %}
             
-            {% if severity_counts.Low|default(0) > 0 %}
-            <div class="severity-low" style="width: {{ (severity_counts.Low / total_vulnerabilities * 100)|round }}%;"></div>
+            {% if severity_counts.Low > 0 %}
+            <div class="severity-low" style="width: {{ severity_percentages.Low }}%;"></div>
             {% endif %}
         </div>
         
         <div class="chart-legend">
-            {% if severity_counts.Critical|default(0) > 0 %}
+            {% if severity_counts.Critical > 0 %}
             <div class="legend-item">
                 <div class="legend-color severity-critical"></div>
                 <div>Critical ({{ severity_counts.Critical }})</div>
             </div>
             {% endif %}
             
-            {% if severity_counts.High|default(0) > 0 %}
+            {% if severity_counts.High > 0 %}
             <div class="legend-item">
                 <div class="legend-color severity-high"></div>
                 <div>High ({{ severity_counts.High }})</div>
             </div>
             {% endif %}
             
-            {% if severity_counts.Medium|default(0) > 0 %}
+            {% if severity_counts.Medium > 0 %}
             <div class="legend-item">
                 <div class="legend-color severity-medium"></div>
                 <div>Medium ({{ severity_counts.Medium }})</div>
             </div>
             {% endif %}
             
-            {% if severity_counts.Low|default(0) > 0 %}
+            {% if severity_counts.Low > 0 %}
             <div class="legend-item">
                 <div class="legend-color severity-low"></div>
                 <div>Low ({{ severity_counts.Low }})</div>
@@ -573,8 +640,7 @@ Report generated using Deep Analytics - Automated Vulnerability Analysis Tool
 """
         
         # Write template to file
-        with open(template_path, 'w') as f:
-            f.write(template_content)
+        self._write_template(template_path, template_content)
             
         logger.info(f"Created default executive summary template: {template_path}")
 
@@ -608,28 +674,14 @@ Report generated using Deep Analytics - Automated Vulnerability Analysis Tool
             # Default to HTML
             return self._generate_html_report(findings, title, author)
 
-    def _generate_html_report(self, findings, title, author):
+    def _generate_html_report(self, findings, title, author, filename=None):
         """Generate an HTML report."""
         try:
-            # Load the template
-            template = self.jinja_env.get_template("report_template.html")
-            
-            # Prepare template variables
-            template_vars = {
-                'title': title,
-                'author': author,
-                'findings': findings,
-                'generation_date': datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                'current_year': datetime.datetime.now().year
-            }
-            
-            # Render the template
-            report_html = template.render(template_vars)
-            
-            # Save the report
-            report_path = self.output_dir / f"{self._sanitize_filename(title)}.html"
-            with open(report_path, 'w') as f:
-                f.write(report_html)
+            # Render the template straight into the report file
+            report_path = self._report_path(filename or self._sanitize_filename(title), ".html")
+            self._render_to_file(
+                self.html_template, self._html_template_vars(findings, title, author), report_path
+            )
             
             logger.info(f"HTML report generated: {report_path}")
             return report_path
@@ -638,28 +690,22 @@ Report generated using Deep Analytics - Automated Vulnerability Analysis Tool
             logger.error(f"Error generating HTML report: {str(e)}")
             return None
 
-    def _generate_markdown_report(self, findings, title, author):
+    def _html_template_vars(self, findings, title, author):
+        """Prepare the variables for the HTML report template."""
+        return {
+            'title': title,
+            'author': author,
+            'findings': self._with_severity_class(findings),
+            **self._date_vars()
+        }
+
+    def _generate_markdown_report(self, findings, title, author, filename=None):
         """Generate a Markdown report."""
         try:
-            # Load the template
-            template = self.jinja_env.get_template("report_template.md")
-            
-            # Prepare template variables
-            template_vars = {
-                'title': title,
-                'author': author,
-                'findings': findings,
-                'generation_date': datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                'current_year': datetime.datetime.now().year
-            }
-            
-            # Render the template
-            report_md = template.render(template_vars)
-            
-            # Save the report
-            report_path = self.output_dir / f"{self._sanitize_filename(title)}.md"
-            with open(report_path, 'w') as f:
-                f.write(report_md)
+            # Markdown needs no escaping, so it is written directly rather than through Jinja2
+            report_path = self._report_path(filename or self._sanitize_filename(title), ".md")
+            with self._open_report(report_path) as f:
+                self._write_markdown(f, findings, title, author, **self._date_vars())
             
             logger.info(f"Markdown report generated: {report_path}")
             return report_path
@@ -668,7 +714,140 @@ Report generated using Deep Analytics - Automated Vulnerability Analysis Tool
             logger.error(f"Error generating Markdown report: {str(e)}")
             return None
 
-    def _generate_json_report(self, findings, title, author):
+    def _write_markdown(self, f, findings, title, author, generation_date, current_year):
+        """
+        Write a Markdown report to an open file.
+        
+        Args:
+            f: Text file to write to
+            findings: List of finding dictionaries
+            title: Report title
+            author: Report author
+            generation_date: Formatted generation date
+            current_year: Year shown in the footer
+        """
+        w = f.write
+        
+        w(f"# {title}\n\n*Generated on: {generation_date}*\n\n")
+        w(f"## Report Information\n**Author:** {author}\n")
+        w(f"**Generation Date:** {generation_date}\n**Total Findings:** {len(findings)}\n\n")
+        w("## Executive Summary\n")
+        w(f"This report details {len(findings)} security vulnerabilities discovered during security testing.\n\n")
+        w("## Findings\n\n")
+        
+        for finding in findings:
+            w(f"### Target: {finding.get('url', '')}\n")
+            w(f"**Status Code:** {finding.get('status_code', '')}\n")
+            w(f"**Server:** {finding.get('server', '')}\n\n")
+            
+            for vuln in finding.get('vulnerabilities', ()):
+                severity = vuln.get('severity', {})
+                w(f"#### {vuln.get('type', '')} - {severity.get('rating', '')} (CVSS: {severity.get('cvss_score', '')})\n")
+                w(f"{vuln.get('description', '')}\n\n")
+                w(f"##### Technical Details\n```json\n{_to_json(vuln.get('technical_details'))}\n```\n\n")
+                w(f"##### Proof of Concept\n```\n{vuln.get('proof_of_concept', '')}\n```\n\n")
+                
+                if vuln.get('potential_cves'):
+                    w("##### Related CVEs\n")
+                    for cve in vuln['potential_cves']:
+                        references = ', '.join(f"[{ref}]({ref})" for ref in cve.get('references', ()))
+                        w(f"**{cve.get('cve_id', '')}** - {cve.get('description', '')}\n")
+                        w(f"**Severity:** {cve.get('severity', '')} (CVSS: {cve.get('cvss_score', '')})\n")
+                        w(f"**References:** {references}\n")
+                w("\n")
+                
+                w("##### Remediation Recommendations\n")
+                for step in vuln.get('remediation', ()):
+                    w(f"- {step}\n")
+                w("\n")
+            w("\n")
+            
+            if finding.get('evidence'):
+                w("##### Evidence\n")
+                for evidence_item in finding['evidence']:
+                    w(f"**Timestamp:** {evidence_item.get('timestamp', '')}\n")
+                    if evidence_item.get('screenshot_path'):
+                        w(f"**Screenshot:** [View Screenshot]({evidence_item['screenshot_path']})\n")
+                    w(f"\n**HTTP Request:**\n```\n{evidence_item.get('http_request', '')}\n```\n\n")
+                    w(f"**HTTP Response:**\n```\n{evidence_item.get('http_response', '')}\n```\n\n")
+                    w(f"**Notes:** {evidence_item.get('notes', '')}\n\n")
+            w("\n")
+        
+        w("\n---\n\nReport generated using Deep Analytics - Automated Vulnerability Analysis Tool\n")
+        w(f"© {current_year} Security Research Team")
+
+    def _date_vars(self):
+        """Return the generation date template variables, read from one clock call."""
+        now = datetime.datetime.now()
+        return {
+            'generation_date': now.strftime('%Y-%m-%d %H:%M:%S'),
+            'current_year': now.year
+        }
+
+    def _with_severity_class(self, findings):
+        """
+        Return shallow copies of findings with the CSS severity class precomputed.
+        
+        Args:
+            findings: List of finding dictionaries
+            
+        Returns:
+            List of finding dictionaries with a 'severity_class' key added
+        """
+        # Copies keep the extra key out of the caller's findings and JSON reports
+        return [
+            dict(
+                finding,
+                severity_class=finding['vulnerabilities'][0]['severity']['rating'].lower()
+                if finding.get('vulnerabilities') else 'low'
+            )
+            for finding in findings
+        ]
+
+    def _render_to_file(self, template, template_vars, path):
+        """
+        Render a template to a file in chunks, without building the whole output in memory.
+        
+        Args:
+            template: Jinja2 template to render
+            template_vars: Variables passed to the template
+            path: Path of the file to write
+        """
+        stream = template.stream(template_vars)
+        # Group template output into fewer, larger writes
+        stream.enable_buffering(size=64)
+        with self._open_report(path) as f:
+            stream.dump(f)
+
+    def _report_path(self, name, extension):
+        """Return the output path for a report, with a .gz suffix when compressing."""
+        if self.compress:
+            extension += ".gz"
+        return self.output_dir / f"{name}{extension}"
+
+    def _open_report(self, path, binary=False):
+        """
+        Open a report file for writing, gzip-compressed if its name ends in .gz.
+        
+        Args:
+            path: Path of the report file
+            binary: Open for bytes rather than UTF-8 text
+            
+        Returns:
+            Writable file object
+        """
+        if path.suffix == ".gz":
+            # Level 1 compresses faster than the disk writes, while HTTP dumps
+            # still shrink several times over
+            if binary:
+                return gzip.open(path, 'wb', compresslevel=1)
+            return gzip.open(path, 'wt', compresslevel=1, encoding='utf-8')
+        
+        if binary:
+            return open(path, 'wb', buffering=self.WRITE_BUFFER_SIZE)
+        return open(path, 'w', encoding='utf-8', buffering=self.WRITE_BUFFER_SIZE)
+
+    def _generate_json_report(self, findings, title, author, filename=None):
         """Generate a JSON report."""
         try:
             # Prepare report data
@@ -680,9 +859,13 @@ Report generated using Deep Analytics - Automated Vulnerability Analysis Tool
             }
             
             # Save the report
-            report_path = self.output_dir / f"{self._sanitize_filename(title)}.json"
-            with open(report_path, 'w') as f:
-                json.dump(report_data, f, indent=2)
+            report_path = self._report_path(filename or self._sanitize_filename(title), ".json")
+            if ORJSON_AVAILABLE:
+                with self._open_report(report_path, binary=True) as f:
+                    f.write(orjson.dumps(report_data, option=ORJSON_REPORT_OPTIONS))
+            else:
+                with self._open_report(report_path) as f:
+                    json.dump(report_data, f, indent=2)
             
             logger.info(f"JSON report generated: {report_path}")
             return report_path
@@ -691,36 +874,71 @@ Report generated using Deep Analytics - Automated Vulnerability Analysis Tool
             logger.error(f"Error generating JSON report: {str(e)}")
             return None
 
-    def _generate_pdf_report(self, findings, title, author):
+    def _generate_pdf_report(self, findings, title, author, filename=None):
         """Generate a PDF report (via HTML conversion)."""
         try:
-            # First generate HTML report
-            html_path = self._generate_html_report(findings, title, author)
-            if not html_path:
-                return None
-            
-            # Attempt to convert to PDF
-            try:
-                # Try to import required libraries
-                import pdfkit
-                
-                # Define PDF output path
-                pdf_path = self.output_dir / f"{self._sanitize_filename(title)}.pdf"
-                
-                # Convert HTML to PDF
-                pdfkit.from_file(str(html_path), str(pdf_path))
-                
-                logger.info(f"PDF report generated: {pdf_path}")
-                return pdf_path
-                
-            except ImportError:
-                logger.warning("pdfkit not installed. Falling back to HTML report.")
-                return html_path
+            # Define PDF output path
+            name = filename or self._sanitize_filename(title)
+            pdf_path = self.output_dir / f"{name}.pdf"
+            
+            # Without wkhtmltopdf on PATH nothing can convert the report,
+            # so keep it usable as HTML
+            converter = self._get_pdf_converter()
+            if not converter:
+                logger.warning("wkhtmltopdf not found. Falling back to HTML report.")
+                return self._generate_html_report(findings, title, author, filename)
+            
+            # The shared wkhtmltopdf process reads its input from files, so
+            # it converts an uncompressed HTML report
+            html_path = self.output_dir / f"{name}.html"
+            self._render_to_file(
+                self.html_template, self._html_template_vars(findings, title, author), html_path
+            )
+            return self._convert_to_pdf(converter, html_path, pdf_path)
                 
         except Exception as e:
             logger.error(f"Error generating PDF report: {str(e)}")
             return None
 
+    def _convert_to_pdf(self, converter, html_path, pdf_path):
+        """
+        Queue an HTML report for conversion to PDF on the shared converter.
+        
+        Args:
+            converter: Shared PdfConverter
+            html_path: Path of the HTML report
+            pdf_path: Path of the PDF to write
+            
+        Returns:
+            Path to the PDF, or to the HTML report if wkhtmltopdf has exited
+        """
+        try:
+            converter.submit(html_path, pdf_path, remove_html=not self.keep_html)
+        except OSError as e:
+            # wkhtmltopdf has exited, so its stdin pipe is closed
+            logger.warning(f"wkhtmltopdf is not running ({str(e)}). Falling back to HTML report.")
+            return html_path
+        
+        logger.info(f"PDF report queued: {pdf_path}")
+        return pdf_path
+
+    def _get_pdf_converter(self):
+        """Return the shared PDF converter, starting it on first use; None if wkhtmltopdf is missing."""
+        with self._pdf_converter_lock:
+            if self._pdf_converter is None:
+                executable = shutil.which('wkhtmltopdf')
+                if not executable:
+                    return None
+                self._pdf_converter = PdfConverter(executable)
+            return self._pdf_converter
+
+    def close(self):
+        """Wait for queued PDF conversions to finish and stop the converter."""
+        with self._pdf_converter_lock:
+            converter, self._pdf_converter = self._pdf_converter, None
+        if converter:
+            converter.close()
+
     def generate_executive_summary(self, findings):
         """
         Generate an executive summary of the findings.
@@ -732,38 +950,51 @@ Report generated using Deep Analytics - Automated Vulnerability Analysis Tool
             Path to the generated summary
         """
         try:
-            # Count vulnerabilities by type and severity
+            # Count vulnerabilities by type and severity, collecting top
+            # recommendations in the same pass
             total_vulnerabilities = 0
             severity_counts = {'Critical': 0, 'High': 0, 'Medium': 0, 'Low': 0}
             vuln_type_summary = {}
+            # Dict keys keep the recommendations unique and in first-seen order
+            top_recommendations = {}
             
             for finding in findings:
+                url = finding.get('url', '')
                 for vuln in finding.get('vulnerabilities', []):
                     total_vulnerabilities += 1
                     severity = vuln.get('severity', {}).get('rating', 'Medium')
                     severity_counts[severity] = severity_counts.get(severity, 0) + 1
                     
                     vuln_type = vuln.get('type', 'Unknown')
-                    if vuln_type not in vuln_type_summary:
-                        vuln_type_summary[vuln_type] = {
+                    type_summary = vuln_type_summary.get(vuln_type)
+                    if type_summary is None:
+                        type_summary = vuln_type_summary[vuln_type] = {
                             'count': 0,
                             'severity': severity,
-                            'urls': []
+                            'urls': set()
                         }
                     
-                    vuln_type_summary[vuln_type]['count'] += 1
-                    vuln_type_summary[vuln_type]['urls'].append(finding.get('url', ''))
+                    type_summary['count'] += 1
+                    type_summary['urls'].add(url)
+                    
+                    # Only the first five recommendations are shown, so stop
+                    # collecting once they are in
+                    if severity in ('Critical', 'High') and len(top_recommendations) < 5:
+                        # Get top 2 recommendations
+                        top_recommendations.update(dict.fromkeys(vuln.get('remediation', [])[:2]))
             
-            # Collect top recommendations
-            top_recommendations = set()
-            for finding in findings:
-                for vuln in finding.get('vulnerabilities', []):
-                    if vuln.get('severity', {}).get('rating') in ['Critical', 'High']:
-                        for rec in vuln.get('remediation', [])[:2]:  # Get top 2 recommendations
-                            top_recommendations.add(rec)
+            # List each affected URL once
+            for details in vuln_type_summary.values():
+                details['urls'] = sorted(details['urls'])
+            
+            template = self.exec_summary_template
             
-            # Load the template
-            template = self.jinja_env.get_template("executive_summary_template.html")
+            # Chart widths, computed here rather than per bar in the template
+            severity_percentages = {
+                severity: round(count / total_vulnerabilities * 100, 0)
+                for severity, count in severity_counts.items()
+                if count
+            }
             
             # Prepare template variables
             template_vars = {
@@ -771,19 +1002,15 @@ Report generated using Deep Analytics - Automated Vulnerability Analysis Tool
                 'findings': findings,
                 'total_vulnerabilities': total_vulnerabilities,
                 'severity_counts': severity_counts,
+                'severity_percentages': severity_percentages,
                 'vuln_type_summary': vuln_type_summary,
                 'top_recommendations': list(top_recommendations)[:5],  # Top 5 recommendations
-                'generation_date': datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                'current_year': datetime.datetime.now().year
+                **self._date_vars()
             }
             
-            # Render the template
-            summary_html = template.render(template_vars)
-            
-            # Save the summary
-            summary_path = self.output_dir / "executive_summary.html"
-            with open(summary_path, 'w') as f:
-                f.write(summary_html)
+            # Render the template straight into the summary file
+            summary_path = self._report_path("executive_summary", ".html")
+            self._render_to_file(template, template_vars, summary_path)
             
             logger.info(f"Executive summary generated: {summary_path}")
             return summary_path
@@ -812,32 +1039,52 @@ Report generated using Deep Analytics - Automated Vulnerability Analysis Tool
             if finding.get('vulnerabilities') and finding['vulnerabilities'][0].get('type'):
                 vuln_type = finding['vulnerabilities'][0]['type']
             
-            title = f"{vuln_type} in {urlparse(finding.get('url', '')).netloc}"
+            netloc_match = NETLOC_PATTERN.match(finding.get('url', ''))
+            title = f"{vuln_type} in {netloc_match.group(1) if netloc_match else ''}"
+            
+            # Prefix the filename so findings of the same type on one host
+            # don't overwrite each other's reports
+            filename = self._sanitize_filename(f"{filename_prefix}_{title}")
             
             # Generate the report
             if self.output_format == "html":
-                return self._generate_html_report(findings, title, "Security Researcher")
+                return self._generate_html_report(findings, title, "Security Researcher", filename)
             elif self.output_format == "markdown":
-                return self._generate_markdown_report(findings, title, "Security Researcher")
+                return self._generate_markdown_report(findings, title, "Security Researcher", filename)
             elif self.output_format == "json":
-                return self._generate_json_report(findings, title, "Security Researcher")
+                return self._generate_json_report(findings, title, "Security Researcher", filename)
             elif self.output_format == "pdf":
-                return self._generate_pdf_report(findings, title, "Security Researcher")
+                return self._generate_pdf_report(findings, title, "Security Researcher", filename)
             
         except Exception as e:
             logger.error(f"Error generating single vulnerability report: {str(e)}")
             return None
 
-    def _sanitize_filename(self, filename):
-        """Sanitize a string for use as a filename."""
-        # Replace invalid characters
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            filename = filename.replace(char, '_')
+    def generate_vulnerability_reports(self, findings, filename_prefix="vulnerability"):
+        """
+        Generate a single-vulnerability report for each finding, in parallel threads.
         
-        # Limit length
-        max_length = 50
-        if len(filename) > max_length:
-            filename = filename[:max_length]
+        Args:
+            findings: List of finding dictionaries
+            filename_prefix: Prefix for the output filenames, numbered from 1
+            
+        Returns:
+            Iterator of report paths (None for failed reports), in findings order
+        """
+        prefixes = [f"{filename_prefix}_{i}" for i in range(1, len(findings) + 1)]
         
-        return filename
\ No newline at end of file
+        # Threads share this process's templates, PDF converter and logging
+        # handlers; each finding is written to its own file
+        max_workers = min(10, len(findings))
+        if max_workers <= 1:
+            for finding, prefix in zip(findings, prefixes):
+                yield self.generate_single_vulnerability_report(finding, prefix)
+            return
+            
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            yield from executor.map(self.generate_single_vulnerability_report, findings, prefixes)
+
+    def _sanitize_filename(self, filename):
+        """Sanitize a string for use as a filename."""
+        # Replacement is one character for one, so truncating first is safe
+        return filename[:self.MAX_FILENAME_LENGTH].translate(self.FILENAME_TRANSLATION)
\ No newline at end of file
@@ -5,12 +5,29 @@ Vulnerability analyzer module for detecting and classifying security vulnerabili
 
 import logging
 import re
+from collections import Counter
 from concurrent.futures import ThreadPoolExecutor, as_completed
-import requests
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
 
 logger = logging.getLogger("deep_analytics.analyzer")
 
+# Base CVSS scores for different vulnerability types
+BASE_CVSS_SCORES = {
+    'SQLi': 8.5,
+    'RCE': 9.8,
+    'XSS': 6.1,
+    'LFI': 7.5
+}
+
+# CVSS vectors for different vulnerability types
+CVSS_VECTORS = {
+    'SQLi': 'CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:H/I:H/A:L',
+    'RCE': 'CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:H/I:H/A:H',
+    'XSS': 'CVSS:3.1/AV:N/AC:L/PR:N/UI:R/S:C/C:L/I:L/A:N',
+    'LFI': 'CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:H/I:N/A:N'
+}
+DEFAULT_CVSS_VECTOR = 'CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:H/I:L/A:L'
+
 class VulnerabilityAnalyzer:
     """Analyzes scan data to identify and classify security vulnerabilities."""
 
@@ -27,6 +44,10 @@ class VulnerabilityAnalyzer:
         self.evidence_collector = evidence_collector
         self.verify_vulnerabilities = verify_vulnerabilities
 
+        # Tallies for the most recent analyze() run
+        self.severity_counts = Counter()
+        self.type_counts = Counter()
+
         # Define vulnerability types and their analysis methods
         self.vulnerability_types = {
             'SQLi': self.analyze_sqli,
@@ -74,6 +95,8 @@ class VulnerabilityAnalyzer:
             List of dictionaries containing vulnerability findings
         """
         findings = []
+        self.severity_counts = Counter()
+        self.type_counts = Counter()
 
         # Process each target in the scan data
         with ThreadPoolExecutor(max_workers=10) as executor:
@@ -90,6 +113,10 @@ class VulnerabilityAnalyzer:
                     result = future.result()
                     if result:
                         findings.append(result)
+                        # Tally here so callers need not walk the findings again
+                        for vuln in result['vulnerabilities']:
+                            self.severity_counts[vuln['severity']['rating']] += 1
+                            self.type_counts[vuln['type']] += 1
                 except Exception as e:
                     logger.error(f"Error analyzing target {target.get('URL', 'unknown')}: {str(e)}")
 
@@ -285,6 +312,9 @@ class VulnerabilityAnalyzer:
         # This is for demonstration and would need more sophisticated checks in a real tool
 
         try:
+            # Only import if needed
+            import requests
+
             # Extract base URL and parameters
             parsed_url = urlparse(url)
             base_url = urlunparse((parsed_url.scheme, parsed_url.netloc, parsed_url.path, '', '', ''))
@@ -443,16 +473,8 @@ class VulnerabilityAnalyzer:
         Returns:
             Dictionary containing severity information
         """
-        # Base CVSS scores for different vulnerability types
-        base_scores = {
-            'SQLi': 8.5,
-            'RCE': 9.8,
-            'XSS': 6.1,
-            'LFI': 7.5
-        }
-
         # Adjust score based on various factors
-        score = base_scores.get(vuln_type, 5.0)
+        score = BASE_CVSS_SCORES.get(vuln_type, 5.0)
 
         # Adjust for authentication
         if 'login' in url or 'admin' in url:
@@ -477,16 +499,7 @@ class VulnerabilityAnalyzer:
             rating = 'Low'
 
         # Generate CVSS vector
-        if vuln_type == 'SQLi':
-            vector = 'CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:H/I:H/A:L'
-        elif vuln_type == 'RCE':
-            vector = 'CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:H/I:H/A:H'
-        elif vuln_type == 'XSS':
-            vector = 'CVSS:3.1/AV:N/AC:L/PR:N/UI:R/S:C/C:L/I:L/A:N'
-        elif vuln_type == 'LFI':
-            vector = 'CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:H/I:N/A:N'
-        else:
-            vector = 'CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:H/I:L/A:L'
+        vector = CVSS_VECTORS.get(vuln_type, DEFAULT_CVSS_VECTOR)
 
         return {
             'rating': rating,